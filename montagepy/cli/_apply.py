@@ -0,0 +1,18 @@
+"""Shared helper for applying CLI arguments to a Config."""
+
+from click.core import ParameterSource
+
+
+def apply_cli_overrides(cfg, ctx) -> None:
+    """Copy command-line-supplied parameters from a Click context onto cfg.
+
+    Only parameters the user actually typed on the command line override
+    the config: defaults never clobber YAML-loaded values, and an explicit
+    value equal to the default still wins. One data-driven loop serves
+    every command instead of a per-command chain of comparisons.
+    """
+    for name, value in ctx.params.items():
+        if name == "input_path":
+            continue
+        if ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE:
+            setattr(cfg, name, value)
@@ -1,11 +1,32 @@
 """Main CLI group for MontagePy."""
 
+import importlib
+
 import click
 
-from montagepy.cli.commands import gif, jpg
+# Subcommand name -> module path. Modules are imported only when a command
+# is actually invoked, so `montagepy --help` never pays for PIL, PyAV and
+# the processing pipeline that the command modules pull in transitively.
+_COMMANDS = {
+    "jpg": "montagepy.cli.commands.jpg",
+    "gif": "montagepy.cli.commands.gif",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list:
+        return sorted(_COMMANDS)
 
+    def get_command(self, ctx: click.Context, name: str):
+        module_path = _COMMANDS.get(name)
+        if module_path is None:
+            return None
+        return getattr(importlib.import_module(module_path), name)
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.option(
     "-c",
     "--config",
@@ -44,8 +65,3 @@ def cli(ctx: click.Context, config: str = None, quiet: bool = False, verbose: bo
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
-
-# Register subcommands
-cli.add_command(jpg)
-cli.add_command(gif)
-
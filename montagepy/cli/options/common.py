@@ -84,6 +84,12 @@ def add_common_options(func):
         default=8,
         help="Maximum number of threads for parallel processing.",
     )(func)
+    func = click.option(
+        "--worker-type",
+        type=click.Choice(["thread", "process"]),
+        default="thread",
+        help="Executor type for parallel frame extraction.",
+    )(func)
     func = click.option(
         "--overwrite",
         is_flag=True,
@@ -1,10 +1,30 @@
 """Custom Click parameter types for MontagePy."""
 
-from pathlib import Path
+import os
+from functools import lru_cache
 
 import click
 
 
+@lru_cache(maxsize=128)
+def _font_exists_cached(value: str) -> bool:
+    return os.path.isfile(value)
+
+
+def font_exists(value: str) -> bool:
+    """Check whether a font file exists, memoizing the stat per process.
+
+    The same font path is checked by the option type and again after the
+    config file is loaded; fonts rarely change, so one stat per path per
+    process is enough. The check uses isfile rather than exists since a
+    directory is never a usable font. Set MONTAGEPY_NO_FONT_CACHE to
+    disable the memoization, e.g. when swapping font files in place.
+    """
+    if os.environ.get("MONTAGEPY_NO_FONT_CACHE"):
+        return os.path.isfile(value)
+    return _font_exists_cached(value)
+
+
 class FontFilePath(click.ParamType):
     """Custom path type that allows empty string but validates non-empty paths."""
 
@@ -14,8 +34,7 @@ class FontFilePath(click.ParamType):
         if not value or value == "":
             return ""
         # Validate path exists if non-empty
-        path = Path(value)
-        if not path.exists():
+        if not font_exists(value):
             self.fail(f"Path '{value}' does not exist", param, ctx)
-        return str(path)
+        return value
 
@@ -2,11 +2,21 @@
 
 from typing import List
 
-from PIL import Image
+import numpy as np
+from PIL import Image, features
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
-from montagepy.core.models import VideoClip
+from montagepy.core.models import GifClip, VideoClip
+
+# libimagequant fuses palette construction and remapping into one C pass
+# with better perceptual quality than median cut; Pillow only exposes it
+# when compiled against the library, so fall back to MEDIANCUT otherwise.
+_QUANTIZE_METHOD = (
+    Image.Quantize.LIBIMAGEQUANT
+    if features.check_feature("libimagequant")
+    else Image.Quantize.MEDIANCUT
+)
 
 
 class GifConverter:
@@ -22,7 +32,7 @@ class GifConverter:
         self.config = config
         self.logger = logger
 
-    def convert_clip_to_gif(self, clip: VideoClip, width: int, height: int) -> Image.Image:
+    def convert_clip_to_gif(self, clip: VideoClip, width: int, height: int) -> GifClip:
         """Convert a video clip to GIF format.
 
         Args:
@@ -31,7 +41,7 @@ class GifConverter:
             height: Target height
 
         Returns:
-            PIL.Image: GIF image object
+            GifClip with the prepared frames and playback parameters
         """
         if not clip.frames:
             raise ValueError("Clip has no frames")
@@ -39,14 +49,26 @@ class GifConverter:
         # Resample frames to match target FPS
         frames = self._resample_frames(clip.frames, clip.duration)
 
-        # Resize frames if necessary
-        resized_frames = []
-        for frame in frames:
-            if frame.size[0] != width or frame.size[1] != height:
-                resized_frame = frame.resize((width, height), Image.Resampling.LANCZOS)
-            else:
-                resized_frame = frame
-            resized_frames.append(resized_frame)
+        # Clips extracted with return_numpy carry uint8 arrays; wrap only
+        # the frames that survived resampling. Image.fromarray shares the
+        # buffer of a C-contiguous array instead of copying it.
+        if isinstance(frames[0], np.ndarray):
+            frames = [Image.fromarray(frame) for frame in frames]
+
+        # Resize frames if necessary. All frames in a clip share dimensions,
+        # so the decision is made once instead of per frame. Large sources
+        # get an integer reduce() pre-pass (Pillow's fast box filter) so the
+        # expensive LANCZOS pass runs on roughly the target pixel count.
+        src_width, src_height = frames[0].size
+        if src_width == width and src_height == height:
+            resized_frames = frames
+        else:
+            factor = max(1, min(src_width // width, src_height // height))
+            resized_frames = []
+            for frame in frames:
+                if factor > 1:
+                    frame = frame.reduce(factor)
+                resized_frames.append(frame.resize((width, height), Image.Resampling.LANCZOS))
 
         # Quantize colors if needed
         if self.config.gif_colors < 256:
@@ -59,14 +81,11 @@ class GifConverter:
         # Calculate frame duration in milliseconds
         frame_duration = int(1000 / self.config.gif_fps)
 
-        # Store frames in a custom attribute for later use in montage composition
-        # We'll create a temporary GIF to get the proper format, but store frames separately
-        first_frame = resized_frames[0].copy()
-        first_frame._frames = resized_frames  # type: ignore
-        first_frame._duration = frame_duration  # type: ignore
-        first_frame._loop = self.config.gif_loop  # type: ignore
-
-        return first_frame
+        return GifClip(
+            frames=resized_frames,
+            duration_ms=frame_duration,
+            loop=self.config.gif_loop,
+        )
 
     def _resample_frames(self, frames: List[Image.Image], duration: float) -> List[Image.Image]:
         """Resample frames to match target FPS.
@@ -92,16 +111,13 @@ class GifConverter:
         if target_frame_count <= 0:
             target_frame_count = 1
 
-        step = len(frames) / target_frame_count
-        sampled_frames = []
-
-        for i in range(target_frame_count):
-            index = int(i * step)
-            if index >= len(frames):
-                index = len(frames) - 1
-            sampled_frames.append(frames[index])
-
-        return sampled_frames
+        # Compute all sample indices in one vectorized call instead of a
+        # per-frame Python loop with a bounds-check branch
+        indices = np.minimum(
+            np.linspace(0, len(frames), target_frame_count, endpoint=False).astype(np.int64),
+            len(frames) - 1,
+        )
+        return [frames[i] for i in indices.tolist()]
 
     def _quantize_colors(self, frames: List[Image.Image], colors: int) -> List[Image.Image]:
         """Quantize colors to specified number.
@@ -114,25 +130,42 @@ class GifConverter:
             Quantized frames
         """
         quantized_frames = []
+        dither = Image.Dither.FLOYDSTEINBERG if self.config.gif_dither else Image.Dither.NONE
+
+        # Clips are short and scene-coherent, so build one palette from a
+        # representative middle frame and remap every frame against it: one
+        # palette construction instead of N, and the shared palette keeps
+        # colors temporally stable across the animation. Very short clips
+        # keep per-frame palettes since there is little to amortize.
+        palette_img = None
+        if len(frames) >= 4:
+            ref = self._flatten_to_rgb(frames[len(frames) // 2])
+            palette_img = ref.quantize(colors=colors, method=_QUANTIZE_METHOD)
 
         for frame in frames:
-            # Convert to RGB if needed
-            if frame.mode not in ("RGB", "RGBA"):
-                frame = frame.convert("RGB")
-
-            # Quantize colors
-            if frame.mode == "RGBA":
-                # For RGBA, we need to handle transparency
-                # Convert to RGB with white background
-                rgb_frame = Image.new("RGB", frame.size, (255, 255, 255))
-                rgb_frame.paste(frame, mask=frame.split()[3] if len(frame.split()) > 3 else None)
-                frame = rgb_frame
-
-            # Quantize
-            quantized = frame.quantize(colors=colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.FLOYDSTEINBERG if self.config.gif_dither else Image.Dither.NONE)
-            # Convert back to RGB for consistency
-            quantized = quantized.convert("RGB")
+            frame = self._flatten_to_rgb(frame)
+
+            # Quantize. The result stays in palette mode: downstream paste
+            # calls convert on the fly, and converting back to RGB here just
+            # added a full-frame copy per frame.
+            if palette_img is not None:
+                quantized = frame.quantize(palette=palette_img, dither=dither)
+            else:
+                quantized = frame.quantize(colors=colors, method=_QUANTIZE_METHOD, dither=dither)
             quantized_frames.append(quantized)
 
         return quantized_frames
 
+    @staticmethod
+    def _flatten_to_rgb(frame: Image.Image) -> Image.Image:
+        """Return the frame in RGB mode, compositing RGBA over white."""
+        if frame.mode == "RGBA":
+            # For RGBA, we need to handle transparency
+            # Convert to RGB with white background
+            rgb_frame = Image.new("RGB", frame.size, (255, 255, 255))
+            rgb_frame.paste(frame, mask=frame.split()[3] if len(frame.split()) > 3 else None)
+            return rgb_frame
+        if frame.mode != "RGB":
+            return frame.convert("RGB")
+        return frame
+
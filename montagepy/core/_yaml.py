@@ -0,0 +1,13 @@
+"""YAML loading shim that picks the fastest available safe loader."""
+
+import yaml
+
+# libyaml's CSafeLoader parses roughly an order of magnitude faster than
+# the pure-Python SafeLoader; fall back transparently when PyYAML was
+# built without the C extension.
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream):
+    """Parse a YAML document with the fastest safe loader available."""
+    return yaml.load(stream, Loader=_LOADER)
@@ -1,9 +1,32 @@
 """Configuration management for MontagePy."""
 
-from dataclasses import dataclass, field
-from typing import List
+import hashlib
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import List, Tuple
 
-import yaml
+from montagepy.core._yaml import safe_load
+
+
+# Color strings are parsed into RGB tuples on every use otherwise; the
+# handful of distinct colors per run makes a small cache a total win. A
+# plain lru_cache (rather than cached_property) stays correct when the
+# color fields are overridden after construction. The parser import is
+# deferred because montagepy.utils pulls grid_utils, which imports this
+# module back.
+@lru_cache(maxsize=32)
+def _parse_color(color_str: str) -> Tuple[int, int, int]:
+    from montagepy.utils.color_utils import parse_color
+
+    return parse_color(color_str)
+
+# Directory holding pickled Config snapshots, keyed by config-file path.
+# Batch scripts spawn one process per video and re-read the same YAML every
+# time; a cache hit costs one stat plus a small pickle load instead of a parse.
+_CONFIG_CACHE_DIR = os.path.expanduser(os.path.join("~", ".cache", "montagepy", "cfg"))
 
 
 @dataclass
@@ -47,6 +70,9 @@ class Config:
     skip_start_percent: float = 5.0  # Percentage of video duration to skip at the start (0-100)
     skip_end_percent: float = 5.0  # Percentage of video duration to skip at the end (0-100)
     max_workers: int = 8  # Maximum number of threads for parallel frame extraction
+    worker_type: str = "thread"  # "thread" or "process" pool for parallel frame extraction
+    dir_parallelism: int = 0  # Videos processed concurrently in directory mode (0 = auto)
+    use_hwaccel: bool = False  # Try hardware-accelerated decoding (falls back to software)
 
     # Output format
     output_format: str = "jpg"  # "jpg" or "gif"
@@ -76,17 +102,51 @@ class Config:
     quiet: bool = False
     verbose: bool = False
 
+    @property
+    def font_rgb(self) -> Tuple[int, int, int]:
+        """font_color parsed to an RGB tuple."""
+        return _parse_color(self.font_color)
+
+    @property
+    def shadow_rgb(self) -> Tuple[int, int, int]:
+        """shadow_color parsed to an RGB tuple."""
+        return _parse_color(self.shadow_color)
+
+    @property
+    def background_rgb(self) -> Tuple[int, int, int]:
+        """background_color parsed to an RGB tuple."""
+        return _parse_color(self.background_color)
+
     @classmethod
     def from_yaml(cls, path: str) -> "Config":
-        """Load configuration from a YAML file."""
+        """Load configuration from a YAML file.
+
+        Parsed configs are cached on disk and validated against the
+        file's (mtime, size), so unchanged files skip the YAML parse on
+        repeat invocations. Any cache failure falls through to a fresh
+        parse.
+        """
+        cache_file = None
+        stat = None
+        try:
+            stat = os.stat(path)
+            digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+            cache_file = os.path.join(_CONFIG_CACHE_DIR, f"{digest}.pkl")
+            with open(cache_file, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot["mtime"] == stat.st_mtime and snapshot["size"] == stat.st_size:
+                return snapshot["cfg"]
+        except Exception:
+            pass
+
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = safe_load(f) or {}
 
         # Convert dict to Config, only including fields that exist in Config
         config_dict = {}
         for key, value in data.items():
             # Convert snake_case keys from YAML to the dataclass field names
-            if hasattr(cls, key):
+            if key in cls._FIELDS:
                 # Special handling for duration_grid_rules
                 if key == "duration_grid_rules" and isinstance(value, list):
                     rules = []
@@ -105,7 +165,36 @@ class Config:
                 else:
                     config_dict[key] = value
 
-        return cls(**config_dict)
+        config = cls(**config_dict)
+
+        # Write the snapshot atomically; a failed write only means the next
+        # run parses again
+        if cache_file is not None:
+            try:
+                os.makedirs(_CONFIG_CACHE_DIR, exist_ok=True)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(
+                        {"mtime": stat.st_mtime, "size": stat.st_size, "cfg": config}, f
+                    )
+                os.replace(tmp_file, cache_file)
+            except Exception:
+                pass
+
+        return config
+
+    @classmethod
+    def from_yaml_many(cls, paths: List[str]) -> List["Config"]:
+        """Load several configuration files in parallel.
+
+        Batch wrappers that feed one config per video can load them all
+        in one call; the reads, cache stats and parses overlap on a
+        thread pool, and results keep the input order.
+        """
+        if len(paths) <= 1:
+            return [cls.from_yaml(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return list(executor.map(cls.from_yaml, paths))
 
     def merge(self, other: "Config") -> None:
         """Merge another config into this one, only overwriting non-default values."""
@@ -113,3 +202,9 @@ class Config:
             if field_value is not None and field_value != "":
                 setattr(self, field_name, field_value)
 
+
+# The field set is fixed at class-definition time; precomputing it lets
+# from_yaml filter keys with an O(1) frozenset lookup instead of a
+# descriptor-protocol hasattr per YAML key.
+Config._FIELDS = frozenset(f.name for f in fields(Config))
+
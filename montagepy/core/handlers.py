@@ -1,27 +1,59 @@
 """Business logic handlers for processing video files."""
 
+import copy
+import os
+import queue
 import sys
+import threading
+import traceback
+from concurrent.futures import CancelledError, ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
-from montagepy.converters.gif_converter import GifConverter
-from montagepy.extractors.clip_extractor import ClipExtractor
-from montagepy.extractors.frame_extractor import FrameExtractor
-from montagepy.renderers.gif_montage_renderer import GifMontageRenderer
-from montagepy.renderers.montage_renderer import MontageRenderer
-from montagepy.utils.file_utils import generate_unique_filename, scan_video_files
-from montagepy.utils.grid_utils import get_grid_size_by_duration
-from montagepy.video_info import get_video_info
+from montagepy.utils.file_utils import generate_unique_filename, looks_like_directory, scan_video_files
+from montagepy.utils.grid_utils import compute_thumb_dims, get_grid_size_by_duration
 
 
-def process_single_file(cfg: Config, logger: Logger) -> None:
+def process_single_file(cfg: Config, logger: Logger, cancel=None, input_path=None) -> None:
     """Process a single video file.
 
     Args:
         cfg: Configuration object
         logger: Logger instance
+        cancel: Optional zero-argument callable polled between stages
+            (and between frames during extraction); returning True
+            aborts the run with CancelledError
+        input_path: Optional input file overriding cfg.input_path.
+            Callers fanning one shared config across many files pass the
+            path here; the shared config is never written to (this
+            function mutates output_path and the grid fields, so it
+            detaches one working copy internally)
+
+    Raises:
+        CancelledError: If cancel() returned True mid-run
     """
+
+    def _check_cancel():
+        if cancel is not None and cancel():
+            raise CancelledError()
+
+    if input_path is not None:
+        cfg = copy.copy(cfg)
+        cfg.input_path = input_path
+
+    # Deferred: the extractors, converters and renderers pull in PyAV,
+    # PIL and numpy, which importers of this module (GUI startup, CLI
+    # paths that fail argument checks) should not pay for up front.
+    import numpy as np
+
+    from montagepy.converters.gif_converter import GifConverter
+    from montagepy.extractors.clip_extractor import ClipExtractor
+    from montagepy.extractors.frame_extractor import FrameExtractor
+    from montagepy.renderers.gif_montage_renderer import GifMontageRenderer
+    from montagepy.renderers.montage_renderer import MontageRenderer
+    from montagepy.video_info import get_video_info
+
     # Set output path if not specified
     if not cfg.output_path:
         input_dir = Path(cfg.input_path).parent
@@ -32,13 +64,9 @@ def process_single_file(cfg: Config, logger: Logger) -> None:
     # Check if output file exists or is a directory
     if cfg.output_path and cfg.output_path != "-":
         output_path_obj = Path(cfg.output_path)
-        
+
         # If output path is a directory (or looks like one without extension), generate filename
-        is_directory = (output_path_obj.exists() and output_path_obj.is_dir()) or (
-            not output_path_obj.exists() and not output_path_obj.suffix
-        )
-        
-        if is_directory:
+        if looks_like_directory(cfg.output_path):
             output_path_obj.mkdir(parents=True, exist_ok=True)
             base_name = Path(cfg.input_path).stem
             extension = "gif" if cfg.output_format.lower() == "gif" else "jpg"
@@ -53,6 +81,7 @@ def process_single_file(cfg: Config, logger: Logger) -> None:
         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
     # Get video info
+    _check_cancel()
     logger.info("Analyzing video file: %s", cfg.input_path)
     try:
         video_info = get_video_info(cfg.input_path)
@@ -89,49 +118,89 @@ def process_single_file(cfg: Config, logger: Logger) -> None:
             
             start_offset = video_info.duration * skip_start
             end_offset = video_info.duration * (1.0 - skip_end)
-            duration = end_offset - start_offset
-            interval = duration / num_clips
-            
-            timestamps = [start_offset + (i * interval) for i in range(num_clips)]
+
+            # Equivalent to start + i * (duration / num_clips), computed in
+            # one vectorized call
+            timestamps = np.linspace(start_offset, end_offset, num_clips, endpoint=False).tolist()
             
-            # Extract clips
+            # Extract and convert in a pipeline: a producer thread decodes
+            # clips from the container while this thread runs the CPU-heavy
+            # GIF conversion, so the two stages overlap instead of running
+            # strictly one after the other. The bounded queue keeps at most
+            # a handful of undecoded clips in memory.
             clip_extractor = ClipExtractor(cfg, video_info, logger)
-            clips = clip_extractor.extract_clips(timestamps)
-            
-            # Convert clips to GIFs
             logger.info("Converting clips to GIFs...")
             gif_converter = GifConverter(cfg, logger)
-            gif_images = []
-            clip_timestamps = []
-            
-            for clip in clips:
-                thumb_width = cfg.thumb_width
-                thumb_height = cfg.thumb_height
-                if thumb_height <= 0:
-                    thumb_height = int(thumb_width / (video_info.width / video_info.height))
-                
-                gif_img = gif_converter.convert_clip_to_gif(clip, thumb_width, thumb_height)
-                gif_images.append(gif_img)
-                clip_timestamps.append(clip.timestamp)
-            
+
+            thumb_width, thumb_height = compute_thumb_dims(cfg, video_info)
+
+            clip_queue = queue.Queue(maxsize=max(2, cfg.max_workers))
+            sentinel = object()
+            producer_error = []
+            stop_producing = threading.Event()
+
+            def _produce():
+                clips = clip_extractor.extract_clips_iter(timestamps)
+                try:
+                    for item in clips:
+                        if stop_producing.is_set():
+                            break
+                        clip_queue.put(item)
+                except BaseException as e:
+                    producer_error.append(e)
+                finally:
+                    # Close the generator explicitly so its container is
+                    # released now rather than at garbage collection
+                    clips.close()
+                    clip_queue.put(sentinel)
+
+            producer = threading.Thread(target=_produce, daemon=True)
+            producer.start()
+
+            gif_clips = [None] * num_clips
+            clip_timestamps = [0.0] * num_clips
+            item = None
+            try:
+                while True:
+                    _check_cancel()
+                    item = clip_queue.get()
+                    if item is sentinel:
+                        break
+                    index, clip = item
+                    gif_clips[index] = gif_converter.convert_clip_to_gif(clip, thumb_width, thumb_height)
+                    clip_timestamps[index] = clip.timestamp
+            finally:
+                # On cancellation or a conversion failure the producer may
+                # be blocked on the bounded queue. Tell it to stop, drain up
+                # to its sentinel so the pending put can complete, and join,
+                # so neither the thread nor its open container outlives this
+                # call.
+                stop_producing.set()
+                while item is not sentinel:
+                    item = clip_queue.get()
+                producer.join()
+            if producer_error:
+                raise producer_error[0]
+
             # Render GIF montage
+            _check_cancel()
             logger.info("Composing GIF montage...")
             renderer = GifMontageRenderer(cfg, video_info, logger)
-            renderer.render(gif_images, clip_timestamps)
+            renderer.render(gif_clips, clip_timestamps)
         else:
             # JPG mode: extract frames and render static montage
             extractor = FrameExtractor(cfg, video_info, logger)
-            frames, timestamps = extractor.extract_frames()
+            frames, timestamps = extractor.extract_frames(cancel=cancel)
 
+            _check_cancel()
             renderer = MontageRenderer(cfg, video_info, logger)
             renderer.render(frames, timestamps)
+    except CancelledError:
+        # Cancellation is a caller decision, not a failure; let it
+        # propagate unwrapped so callers can recognize it
+        raise
     except Exception as e:
-        logger.error(f"Failed to generate montage: {e}")
-        # print trace
-        import traceback
-
-        traceback.print_exc()
-        traceback.print_exc()
+        logger.error("Failed to generate montage: %s\n%s", e, traceback.format_exc())
         raise RuntimeError(f"Failed to generate montage: {e}")
 
     if cfg.output_path != "-":
@@ -164,32 +233,45 @@ def process_directory(cfg: Config, logger: Logger) -> None:
         logger.info("Warning: Output to stdout is not supported for directory processing.")
         logger.info("Each video will generate a montage file next to the video file.")
 
-    # Process each video file
-    success_count = 0
-    for i, video_file in enumerate(video_files, 1):
-        logger.info("[%d/%d] Processing: %s", i, len(video_files), video_file)
+    # The output location and format never change during the loop, so
+    # resolve them (and their stat/mkdir syscalls) once up front.
+    out_path_obj = None
+    is_output_dir = False
+    extension = "gif" if cfg.output_format.lower() == "gif" else "jpg"
+    if cfg.output_path and cfg.output_path != "-":
+        out_path_obj = Path(cfg.output_path)
+        # Output is a directory if it exists as one, or doesn't exist and has no extension
+        is_output_dir = looks_like_directory(cfg.output_path)
+        if is_output_dir:
+            out_path_obj.mkdir(parents=True, exist_ok=True)
+
+    # Resolve the input root once; generate_unique_filename otherwise
+    # stats and resolves the same directory for every file
+    input_root = Path(cfg.input_path)
+    try:
+        input_root = input_root.resolve() if input_root.exists() else input_root.absolute()
+    except (OSError, RuntimeError, ValueError):
+        input_root = input_root.absolute()
 
-        # Create a copy of config for this video
-        video_cfg = Config()
-        video_cfg.__dict__.update(cfg.__dict__)
+    # Build one detached config per video up front; the loop below only
+    # dispatches work.
+    video_cfgs = []
+    for video_file in video_files:
+        # Shallow-copy the config for this video; Config is a plain
+        # attribute bag, so this detaches the instance dict without
+        # re-running __init__ (including the default grid-rule list)
+        # for every file.
+        video_cfg = copy.copy(cfg)
         video_cfg.input_path = video_file
 
         # Set output path
-        if cfg.output_path and cfg.output_path != "-":
-            output_path_obj = Path(cfg.output_path)
-            # Check if output path is a directory (exists and is dir, or doesn't exist and has no extension)
-            is_directory = (output_path_obj.exists() and output_path_obj.is_dir()) or (
-                not output_path_obj.exists() and not output_path_obj.suffix
-            )
-
-            if is_directory:
+        if out_path_obj is not None:
+            if is_output_dir:
                 # Output is a directory - use unique filename based on relative path
-                output_path_obj.mkdir(parents=True, exist_ok=True)
-                extension = "gif" if cfg.output_format.lower() == "gif" else "jpg"
-                unique_filename = generate_unique_filename(video_file, cfg.input_path, extension)
-                video_cfg.output_path = str(output_path_obj / unique_filename)
+                unique_filename = generate_unique_filename(video_file, input_root, extension)
+                video_cfg.output_path = str(out_path_obj / unique_filename)
                 if logger:
-                    if logger.verbose:
+                    if logger.verbose_enabled:
                         logger.verbose(f"Video file: {video_file}")
                         logger.verbose(f"Input root: {cfg.input_path}")
                         logger.verbose(f"Generated unique filename: {unique_filename}")
@@ -202,16 +284,51 @@ def process_directory(cfg: Config, logger: Logger) -> None:
         else:
             # Default: place next to video file (will be set in process_single_file)
             video_cfg.output_path = ""
+        video_cfgs.append(video_cfg)
 
-        try:
-            process_single_file(video_cfg, logger)
-            success_count += 1
-        except SystemExit:
-            # Skip files that already exist
-            continue
-        except Exception as e:
-            logger.error(f"Failed to process {video_file}: {e}")
-            continue
+    # Each video writes to an independent output path, so directory mode
+    # is embarrassingly parallel. Processes (not threads) are used
+    # because the palette/encode stages hold the GIL.
+    max_procs = cfg.dir_parallelism
+    if max_procs <= 0:
+        max_procs = os.cpu_count() or 1
+    max_procs = min(max_procs, len(video_files))
+
+    success_count = 0
+    if max_procs <= 1:
+        for i, video_cfg in enumerate(video_cfgs, 1):
+            logger.info("[%d/%d] Processing: %s", i, len(video_files), video_cfg.input_path)
+            try:
+                process_single_file(video_cfg, logger)
+                success_count += 1
+            except SystemExit:
+                # Skip files that already exist
+                continue
+            except Exception as e:
+                logger.error(f"Failed to process {video_cfg.input_path}: {e}")
+                continue
+    else:
+        with ProcessPoolExecutor(max_workers=max_procs) as executor:
+            future_to_cfg = {
+                executor.submit(process_single_file, video_cfg, logger): video_cfg
+                for video_cfg in video_cfgs
+            }
+            completed = 0
+            for future in as_completed(future_to_cfg):
+                video_cfg = future_to_cfg[future]
+                completed += 1
+                try:
+                    future.result()
+                    success_count += 1
+                    logger.info(
+                        "[%d/%d] Finished: %s", completed, len(video_files), video_cfg.input_path
+                    )
+                except SystemExit:
+                    # Skip files that already exist
+                    continue
+                except Exception as e:
+                    logger.error(f"Failed to process {video_cfg.input_path}: {e}")
+                    continue
 
     logger.info("✅ Successfully processed %d/%d video file(s).", success_count, len(video_files))
 
@@ -1,10 +1,10 @@
 """Grid layout logic for irregular grids."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class GridCell:
     """A single cell in the grid."""
     
@@ -22,6 +22,9 @@ class GridLayout:
         self.rows = rows
         self.cols = cols
         self.cells: List[GridCell] = []
+        # Explicit image index -> cell, so get_cell is a dict lookup
+        # instead of an O(N) scan per placement (O(N^2) over a render)
+        self._index_map: dict = {}
 
     @property
     def count(self) -> int:
@@ -48,23 +51,57 @@ class GridLayout:
         if col + col_span > self.cols:
             raise ValueError(f"Cell extends beyond right edge (col {col} + span {col_span} > {self.cols})")
             
-        self.cells.append(GridCell(row, col, row_span, col_span, index))
+        cell = GridCell(row, col, row_span, col_span, index)
+        if index != -1:
+            self._index_map[index] = cell
+        self.cells.append(cell)
+
+    def add_cells(self, specs: Iterable[Tuple]) -> None:
+        """Add many cells in one validated batch.
+
+        For generators that know the whole layout up front, this binds
+        the grid bounds to locals and extends the cell list once, instead
+        of paying per-call attribute lookups and appends in add_cell. If
+        any spec is invalid the layout is left unchanged.
+
+        Args:
+            specs: Iterable of (row, col[, row_span[, col_span[, index]]])
+                tuples, with the same defaults as add_cell
+        """
+        max_rows, max_cols = self.rows, self.cols
+        new_cells: List[GridCell] = []
+        for spec in specs:
+            row, col, row_span, col_span, index = (*spec, 1, 1, -1)[:5]
+            if row < 0 or row >= max_rows:
+                raise ValueError(f"Row {row} is out of bounds (0-{max_rows-1})")
+            if col < 0 or col >= max_cols:
+                raise ValueError(f"Column {col} is out of bounds (0-{max_cols-1})")
+            if row + row_span > max_rows:
+                raise ValueError(f"Cell extends beyond bottom edge (row {row} + span {row_span} > {max_rows})")
+            if col + col_span > max_cols:
+                raise ValueError(f"Cell extends beyond right edge (col {col} + span {col_span} > {max_cols})")
+            new_cells.append(GridCell(row, col, row_span, col_span, index))
+
+        for cell in new_cells:
+            if cell.index != -1:
+                self._index_map[cell.index] = cell
+        self.cells.extend(new_cells)
 
     def get_cell(self, index: int) -> Optional[GridCell]:
         """Get cell for a specific image index.
-        
+
         If cells have explicit indices, use those.
         Otherwise, return the cell at the given list index.
         """
         # First check for explicit index match
-        for cell in self.cells:
-            if cell.index == index:
-                return cell
-                
+        cell = self._index_map.get(index)
+        if cell is not None:
+            return cell
+
         # Fallback to sequential index if within bounds
         if 0 <= index < len(self.cells):
             # If the cell at this position has no explicit index (or -1), use it
             if self.cells[index].index == -1:
                 return self.cells[index]
-                
+
         return None
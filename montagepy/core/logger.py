@@ -1,11 +1,17 @@
 """Logging utilities for MontagePy."""
 
 import sys
-from datetime import datetime
+import time
 
 
 class Logger:
-    """Simple logger for MontagePy."""
+    """Simple logger for MontagePy.
+
+    The *_enabled attributes are plain booleans so hot loops can guard
+    before formatting, e.g. ``if logger.verbose_enabled:
+    logger.verbose(f"...")`` — the f-string is never built when the
+    level is off (same idea as logging.isEnabledFor).
+    """
 
     def __init__(self, quiet: bool = False, verbose: bool = False):
         """Initialize logger.
@@ -15,35 +21,51 @@ class Logger:
             verbose: If True, enable verbose output
         """
         self.quiet = quiet
-        self.verbose = verbose
+        self.info_enabled = not quiet
+        self.error_enabled = not quiet
+        # Named verbose_enabled (not verbose) so the flag does not shadow
+        # the verbose() method below.
+        self.verbose_enabled = verbose and not quiet
+        # The prefix has one-second resolution, so memoize it per second:
+        # under heavy verbose logging this turns most strftime calls into
+        # a single time() call and an int compare.
+        self._last_sec = -1
+        self._last_prefix = ""
 
     def _now(self) -> str:
-        return datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_prefix = time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(sec))
+        return self._last_prefix
 
     def info(self, message: str, *args) -> None:
         """Log an info message."""
-        if not self.quiet:
-            prefix = self._now()
-            if args:
-                print(f"{prefix} {message % args}", file=sys.stderr)
-            else:
-                print(f"{prefix} {message}", file=sys.stderr)
+        if not self.info_enabled:
+            return
+        prefix = self._now()
+        if args:
+            print(f"{prefix} {message % args}", file=sys.stderr)
+        else:
+            print(f"{prefix} {message}", file=sys.stderr)
 
     def verbose(self, message: str, *args) -> None:
         """Log a verbose message."""
-        if self.verbose and not self.quiet:
-            prefix = self._now()
-            if args:
-                print(f"{prefix} {message % args}", file=sys.stderr)
-            else:
-                print(f"{prefix} {message}", file=sys.stderr)
+        if not self.verbose_enabled:
+            return
+        prefix = self._now()
+        if args:
+            print(f"{prefix} {message % args}", file=sys.stderr)
+        else:
+            print(f"{prefix} {message}", file=sys.stderr)
 
     def error(self, message: str, *args) -> None:
         """Log an error message."""
-        if not self.quiet:
-            prefix = self._now()
-            if args:
-                print(f"{prefix} Error: {message % args}", file=sys.stderr)
-            else:
-                print(f"{prefix} Error: {message}", file=sys.stderr)
+        if not self.error_enabled:
+            return
+        prefix = self._now()
+        if args:
+            print(f"{prefix} Error: {message % args}", file=sys.stderr)
+        else:
+            print(f"{prefix} Error: {message}", file=sys.stderr)
 
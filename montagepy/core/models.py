@@ -1,18 +1,19 @@
 """Data models for MontagePy."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Union
 
+import numpy as np
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoClip:
     """Represents a video clip segment."""
 
     start_time: float  # Start time in seconds
     end_time: float  # End time in seconds
-    frames: List[Image.Image]  # List of frames
+    frames: List[Union[Image.Image, np.ndarray]]  # PIL images, or uint8 arrays with return_numpy
     timestamp: float  # Center timestamp (for display)
 
     @property
@@ -25,3 +26,12 @@ class VideoClip:
         """Number of frames in the clip."""
         return len(self.frames)
 
+
+@dataclass(slots=True)
+class GifClip:
+    """An animated clip prepared for GIF montage composition."""
+
+    frames: List[Image.Image]  # Frames resized/quantized for the montage
+    duration_ms: int  # Per-frame display duration in milliseconds
+    loop: int  # Number of loops (0 = infinite)
+
@@ -1,35 +1,43 @@
 """Video clip extraction logic for MontagePy."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+from typing import Iterator, List, Tuple, Union
 
 import av
+import numpy as np
 from PIL import Image
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
 from montagepy.core.models import VideoClip
+from montagepy.utils.grid_utils import compute_thumb_dims
 from montagepy.video_info import VideoInfo
 
 
 class ClipExtractor:
     """Extracts video clips from video files."""
 
-    def __init__(self, config: Config, video_info: VideoInfo, logger: Logger):
+    def __init__(
+        self,
+        config: Config,
+        video_info: VideoInfo,
+        logger: Logger,
+        return_numpy: bool = False,
+    ):
         """Initialize clip extractor.
 
         Args:
             config: Configuration object
             video_info: Video information
             logger: Logger instance
+            return_numpy: If True, clip frames are (H, W, 3) uint8 numpy
+                arrays instead of PIL images, skipping one PIL object
+                allocation and copy per frame for consumers that work on
+                arrays anyway
         """
         self.config = config
         self.video_info = video_info
         self.logger = logger
-        
-        # Use NEAREST for fastest resize (acceptable quality for thumbnails)
-        # For better quality, use Image.Resampling.BILINEAR or LANCZOS
-        self._resample_method = Image.Resampling.BILINEAR
+        self.return_numpy = return_numpy
 
     def extract_clips(self, timestamps: List[float]) -> List[VideoClip]:
         """Extract video clips at specified timestamps.
@@ -38,78 +46,41 @@ class ClipExtractor:
             timestamps: List of center timestamps for each clip
 
         Returns:
-            List of VideoClip objects
+            List of VideoClip objects, ordered to match the input
         """
-        # Calculate clip duration and offsets
-        clip_duration = self.config.gif_clip_duration
-        start_offset = self.config.gif_clip_start_offset
-        end_offset = self.config.gif_clip_end_offset
-
-        # Calculate thumbnail dimensions
-        thumb_width = self.config.thumb_width
-        thumb_height = self.config.thumb_height
-        if thumb_height <= 0:
-            if self.video_info.height == 0:
-                raise ValueError("Video height is 0, cannot auto-calculate thumbnail height")
-            thumb_height = int(thumb_width / (self.video_info.width / self.video_info.height))
-
-        # Extract clips in parallel
-        clips: List[VideoClip] = []
-        max_workers = min(len(timestamps), self.config.max_workers)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(
-                    self._extract_single_clip, ts, start_offset, end_offset, thumb_width, thumb_height
-                ): i
-                for i, ts in enumerate(timestamps)
-            }
-
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    clip = future.result()
-                    clips.append(clip)
-                except Exception as e:
-                    self.logger.error(f"Failed to extract clip {index}: {e}")
-                    raise
-
-        # Sort clips by timestamp to maintain order
-        clips.sort(key=lambda c: c.timestamp)
+        clips: List[VideoClip] = [None] * len(timestamps)  # type: ignore[list-item]
+        for index, clip in self.extract_clips_iter(timestamps):
+            clips[index] = clip
         return clips
 
-    def _extract_single_clip(
-        self,
-        center_time: float,
-        start_offset: float,
-        end_offset: float,
-        thumb_width: int,
-        thumb_height: int,
-    ) -> VideoClip:
-        """Extract a single video clip.
+    def extract_clips_iter(self, timestamps: List[float]) -> Iterator[Tuple[int, VideoClip]]:
+        """Yield (index, VideoClip) pairs as each clip is extracted.
+
+        Clips come out in sorted-timestamp order from a single open
+        container; the index refers back to the position in `timestamps`
+        so callers can restore the input order. Yielding as soon as a clip
+        is decoded lets downstream stages (e.g. GIF conversion) overlap
+        with extraction.
 
         Args:
-            center_time: Center timestamp for the clip
-            start_offset: Start offset from center (negative = before)
-            end_offset: End offset from center (positive = after)
-            thumb_width: Target thumbnail width
-            thumb_height: Target thumbnail height
+            timestamps: List of center timestamps for each clip
 
-        Returns:
-            VideoClip object
+        Yields:
+            Tuples of (input index, VideoClip)
         """
-        # Calculate clip time range
-        start_time = max(0, center_time + start_offset)
-        end_time = min(self.video_info.duration, center_time + end_offset)
+        # Calculate clip offsets
+        start_offset = self.config.gif_clip_start_offset
+        end_offset = self.config.gif_clip_end_offset
 
-        # Ensure valid time range
-        if start_time >= end_time:
-            start_time = max(0, center_time - 1.0)
-            end_time = min(self.video_info.duration, center_time + 1.0)
+        # Calculate thumbnail dimensions
+        thumb_width, thumb_height = compute_thumb_dims(self.config, self.video_info)
 
+        # One container serves every clip: timestamps are visited in sorted
+        # order so each seek moves forward through the file, and the demuxer
+        # and decoder are reused instead of paying an AVFormat probe plus
+        # codec init per clip. For short clips that setup cost dominates.
         container = av.open(self.video_info.path)
-
         try:
-            # Get video stream
             video_stream = None
             for stream in container.streams:
                 if stream.type == "video":
@@ -119,73 +90,247 @@ class ClipExtractor:
             if video_stream is None:
                 raise ValueError("No video stream found")
 
-            # Get the time base for converting frame PTS to seconds
-            time_base = video_stream.time_base
-
-            # Seek to start time
-            seek_pts = int(start_time / time_base)
-            container.seek(seek_pts, stream=video_stream, backward=True, any_frame=False)
-
-            # Extract frames
-            frames: List[Image.Image] = []
-            end_pts = int(end_time / time_base)
-
-            for packet in container.demux(video_stream):
-                if packet.pts is None:
-                    continue
+            ordered = sorted(enumerate(timestamps), key=lambda item: item[1])
+
+            # When adjacent clip windows overlap (short videos, wide
+            # offsets), the per-clip seek-and-decode loop would decode the
+            # shared GOPs more than once. One linear pass over the union
+            # of the windows decodes each frame exactly once and buckets
+            # it into every clip whose window contains it.
+            windows = [
+                (index, ts) + self._clip_window(ts, start_offset, end_offset)
+                for index, ts in ordered
+            ]
+            overlapping = len(windows) > 1 and any(
+                windows[i + 1][2] <= windows[i][3] for i in range(len(windows) - 1)
+            )
+            if overlapping:
+                yield from self._extract_clips_single_pass(
+                    container, video_stream, windows, thumb_width, thumb_height
+                )
+                return
 
-                # Stop if we've passed the end time
-                if packet.pts > end_pts:
-                    break
+            for index, ts in ordered:
+                try:
+                    clip = self._extract_single_clip(
+                        container, video_stream, ts, start_offset, end_offset, thumb_width, thumb_height
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to extract clip {index}: {e}")
+                    raise
+                yield index, clip
+        finally:
+            container.close()
 
-                # Decode frames
-                for decoded_frame in packet.decode():
-                    if decoded_frame.pts is None:
-                        continue
+    def _clip_window(self, center_time: float, start_offset: float, end_offset: float) -> Tuple[float, float]:
+        """Compute the (start_time, end_time) window for a clip center."""
+        start_time = max(0, center_time + start_offset)
+        end_time = min(self.video_info.duration, center_time + end_offset)
 
-                    frame_time = float(decoded_frame.pts * time_base)
+        # Ensure valid time range
+        if start_time >= end_time:
+            start_time = max(0, center_time - 1.0)
+            end_time = min(self.video_info.duration, center_time + 1.0)
 
-                    # Only include frames within the clip range
-                    if start_time <= frame_time <= end_time:
-                        # Convert to PIL Image
-                        pil_image = decoded_frame.to_image()
+        return start_time, end_time
 
-                        # Resize if necessary (using fast NEAREST method)
-                        if pil_image.size[0] != thumb_width or pil_image.size[1] != thumb_height:
-                            pil_image = pil_image.resize(
-                                (thumb_width, thumb_height), self._resample_method
-                            )
+    def _extract_clips_single_pass(
+        self,
+        container: "av.container.InputContainer",
+        video_stream: "av.video.stream.VideoStream",
+        windows: List[Tuple[int, float, float, float]],
+        thumb_width: int,
+        thumb_height: int,
+    ) -> Iterator[Tuple[int, VideoClip]]:
+        """Decode the union of all clip windows once, bucketing by PTS.
 
-                        frames.append(pil_image)
+        Each decoded frame is converted to a thumbnail at most once and
+        appended to every clip whose window covers its PTS, so frames in
+        shared GOPs are decoded and scaled a single time.
 
-            # If no frames extracted, try to get at least one frame
-            if not frames:
-                # Seek to center time and get one frame
-                seek_pts = int(center_time / time_base)
-                container.seek(seek_pts, stream=video_stream, backward=True, any_frame=False)
-                for packet in container.demux(video_stream):
-                    for decoded_frame in packet.decode():
-                        if decoded_frame.key_frame:
-                            pil_image = decoded_frame.to_image()
-                            if pil_image.size[0] != thumb_width or pil_image.size[1] != thumb_height:
-                                pil_image = pil_image.resize(
-                                    (thumb_width, thumb_height), self._resample_method
-                                )
-                            frames.append(pil_image)
-                            break
-                    if frames:
-                        break
+        Args:
+            container: Open input container
+            video_stream: Video stream of the container
+            windows: (input index, center_time, start_time, end_time)
+                tuples sorted by center_time
+            thumb_width: Target thumbnail width
+            thumb_height: Target thumbnail height
 
+        Yields:
+            Tuples of (input index, VideoClip)
+        """
+        time_base = video_stream.time_base
+        bounds = [
+            (index, int(start_time / time_base), int(end_time / time_base))
+            for index, _, start_time, end_time in windows
+        ]
+        frame_lists: dict = {index: [] for index, _, _ in bounds}
+        last_end_pts = max(end_pts for _, _, end_pts in bounds)
+
+        container.seek(
+            int(min(start for _, _, start, _ in windows) / av.time_base),
+            backward=True,
+            any_frame=False,
+        )
+        for packet in container.demux(video_stream):
+            if packet.pts is None:
+                continue
+            if packet.pts > last_end_pts:
+                break
+            for decoded_frame in packet.decode():
+                pts = decoded_frame.pts
+                if pts is None:
+                    continue
+                thumb = None
+                for index, start_pts, end_pts in bounds:
+                    if start_pts <= pts <= end_pts:
+                        if thumb is None:
+                            thumb = self._frame_to_thumb(decoded_frame, thumb_width, thumb_height)
+                        frame_lists[index].append(thumb)
+
+        for index, center_time, start_time, end_time in windows:
+            frames = frame_lists[index]
             if not frames:
-                raise ValueError(f"Could not extract any frames from clip at {center_time:.2f}s")
-
-            return VideoClip(
+                # Nothing landed in this window (e.g. PTS gaps); fall back
+                # to the per-clip path, which has its own keyframe rescue.
+                yield index, self._extract_single_clip(
+                    container,
+                    video_stream,
+                    center_time,
+                    start_time - center_time,
+                    end_time - center_time,
+                    thumb_width,
+                    thumb_height,
+                )
+                continue
+            yield index, VideoClip(
                 start_time=start_time,
                 end_time=end_time,
                 frames=frames,
                 timestamp=center_time,
             )
 
-        finally:
-            container.close()
+    def _extract_single_clip(
+        self,
+        container: "av.container.InputContainer",
+        video_stream: "av.video.stream.VideoStream",
+        center_time: float,
+        start_offset: float,
+        end_offset: float,
+        thumb_width: int,
+        thumb_height: int,
+    ) -> VideoClip:
+        """Extract a single video clip from an already-open container.
 
+        Args:
+            container: Open input container positioned anywhere
+            video_stream: Video stream of the container
+            center_time: Center timestamp for the clip
+            start_offset: Start offset from center (negative = before)
+            end_offset: End offset from center (positive = after)
+            thumb_width: Target thumbnail width
+            thumb_height: Target thumbnail height
+
+        Returns:
+            VideoClip object
+        """
+        # Calculate clip time range
+        start_time, end_time = self._clip_window(center_time, start_offset, end_offset)
+
+        # Get the time base for converting frame PTS to seconds
+        time_base = video_stream.time_base
+
+        # Seek at the container level (offset in av.time_base units):
+        # avformat_seek_file consults the format's keyframe index (moov
+        # atom / Matroska cues) directly, instead of the stream-level
+        # demux-and-scan path, so sparse-keyframe files seek in
+        # O(log keyframes) rather than O(GOP).
+        container.seek(int(start_time / av.time_base), backward=True, any_frame=False)
+
+        # Clip bounds as stream PTS, so the per-frame range check is one
+        # integer compare instead of a Fraction multiply plus two float
+        # compares on every decoded frame.
+        start_pts = int(start_time / time_base)
+        end_pts = int(end_time / time_base)
+
+        # Pre-size the frame list from the stream frame rate; appends into
+        # an unsized list reallocate repeatedly for long clips.
+        try:
+            rate_num, rate_den = self.video_info.avg_frame_rate.split("/")
+            fps = int(rate_num) / int(rate_den)
+        except (ValueError, ZeroDivisionError):
+            fps = 0.0
+        expected = int((end_time - start_time) * fps) + 2 if fps > 0 else 0
+        frames: List[Image.Image] = [None] * expected  # type: ignore[list-item]
+        count = 0
+
+        for packet in container.demux(video_stream):
+            if packet.pts is None:
+                continue
+
+            # Stop if we've passed the end time
+            if packet.pts > end_pts:
+                break
+
+            # Decode frames
+            for decoded_frame in packet.decode():
+                if decoded_frame.pts is None:
+                    continue
+
+                # Only include frames within the clip range
+                if start_pts <= decoded_frame.pts <= end_pts:
+                    thumb = self._frame_to_thumb(decoded_frame, thumb_width, thumb_height)
+                    if count < expected:
+                        frames[count] = thumb
+                    else:
+                        frames.append(thumb)
+                    count += 1
+
+        del frames[count:]
+
+        # If no frames extracted, try to get at least one frame
+        if not frames:
+            # Seek to center time and grab one frame. After a backward
+            # seek the first frame decode yields is the keyframe anchor,
+            # so there is no need to demux the GOP hunting for one.
+            container.seek(int(center_time / av.time_base), backward=True, any_frame=False)
+            for decoded_frame in container.decode(video_stream):
+                frames.append(self._frame_to_thumb(decoded_frame, thumb_width, thumb_height))
+                break
+
+        if not frames:
+            raise ValueError(f"Could not extract any frames from clip at {center_time:.2f}s")
+
+        return VideoClip(
+            start_time=start_time,
+            end_time=end_time,
+            frames=frames,
+            timestamp=center_time,
+        )
+
+    def _frame_to_thumb(
+        self, frame: "av.VideoFrame", thumb_width: int, thumb_height: int
+    ) -> Union[Image.Image, np.ndarray]:
+        """Convert a decoded frame straight to a thumbnail-sized image.
+
+        With return_numpy set, the scaled frame is handed back as an
+        (H, W, 3) uint8 array from to_ndarray(), skipping the PIL object
+        entirely.
+
+        reformat() runs a single libswscale pass that fuses the YUV->RGB
+        conversion with the bilinear downscale, so the full-resolution
+        buffer is read once; to_image() followed by a PIL resize walked it
+        twice and allocated a full-size intermediate image.
+        """
+        reformatted = frame.reformat(
+            width=thumb_width, height=thumb_height, format="rgb24", interpolation="BILINEAR"
+        )
+        if self.return_numpy:
+            return reformatted.to_ndarray()
+        plane = reformatted.planes[0]
+        if plane.line_size == thumb_width * 3:
+            return Image.frombuffer(
+                "RGB", (thumb_width, thumb_height), plane, "raw", "RGB", 0, 1
+            )
+        # Row padding in the plane: let PyAV handle the stride
+        return reformatted.to_image()
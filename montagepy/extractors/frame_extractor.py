@@ -1,15 +1,24 @@
 """Frame extraction logic for MontagePy."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import List, Optional, Tuple
 
 import av
+import numpy as np
+from av.codec.context import Flags2
 from PIL import Image
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
+from montagepy.utils.grid_utils import compute_thumb_dims
 from montagepy.video_info import VideoInfo
 
+# Codecs whose decode cost is high enough to warrant intra-frame decoder
+# threading inside each worker (at the price of running fewer workers)
+_HEAVY_CODECS = {"hevc", "av1", "vp9"}
+
 
 class FrameExtractor:
     """Extracts frames from video files."""
@@ -25,15 +34,23 @@ class FrameExtractor:
         self.config = config
         self.video_info = video_info
         self.logger = logger
+        self._decoder_threads = 2 if video_info.video_codec in _HEAVY_CODECS else 1
 
-    def extract_frames(self, layout: Optional["GridLayout"] = None) -> Tuple[List[Image.Image], List[float]]:
+    def extract_frames(
+        self, layout: Optional["GridLayout"] = None, cancel=None
+    ) -> Tuple[List[Image.Image], List[float]]:
         """Extract frames from video at calculated timestamps.
 
         Args:
             layout: Optional custom grid layout. If provided, uses layout.count for number of frames.
+            cancel: Optional zero-argument callable polled as each batch
+                completes; returning True aborts with CancelledError
 
         Returns:
             Tuple of (frames list, timestamps list)
+
+        Raises:
+            CancelledError: If cancel() returned True mid-extraction
         """
         if layout:
             num_frames = layout.count
@@ -43,12 +60,7 @@ class FrameExtractor:
             raise ValueError("Number of frames must be positive")
 
         # Calculate thumbnail dimensions
-        thumb_width = self.config.thumb_width
-        thumb_height = self.config.thumb_height
-        if thumb_height <= 0:
-            if self.video_info.height == 0:
-                raise ValueError("Video height is 0, cannot auto-calculate thumbnail height")
-            thumb_height = int(thumb_width / (self.video_info.width / self.video_info.height))
+        thumb_width, thumb_height = compute_thumb_dims(self.config, self.video_info)
 
         # Calculate timestamps based on configured skip percentages
         skip_start = self.config.skip_start_percent / 100.0
@@ -74,34 +86,78 @@ class FrameExtractor:
         duration = end_offset - start_offset
         interval = duration / num_frames
 
-        timestamps = [start_offset + (i * interval) for i in range(num_frames)]
+        # One vectorized call instead of a per-index Python loop
+        timestamps = (np.arange(num_frames, dtype=np.float64) * interval + start_offset).tolist()
 
-        # Log timestamps in verbose mode
-        if self.logger and self.logger.verbose:
-            self.logger.verbose(f"Video duration: {self.video_info.duration:.2f}s")
-            self.logger.verbose(f"Extracting {num_frames} frames from {start_offset:.2f}s to {end_offset:.2f}s")
-            self.logger.verbose(f"First 5 timestamps: {[f'{ts:.2f}' for ts in timestamps[:5]]}")
+        # Log timestamps in verbose mode. Bind the bound method once so
+        # the guard is a single truthiness check and none of the f-strings
+        # are built when verbose output is off.
+        log = self.logger.verbose if self.logger and self.logger.verbose_enabled else None
+        if log:
+            log(f"Video duration: {self.video_info.duration:.2f}s")
+            log(f"Extracting {num_frames} frames from {start_offset:.2f}s to {end_offset:.2f}s")
+            log(f"First 5 timestamps: {[f'{ts:.2f}' for ts in timestamps[:5]]}")
 
         # Extract frames in parallel
         frames: List[Optional[Image.Image]] = [None] * num_frames
         actual_timestamps: List[float] = [0.0] * num_frames  # Store actual keyframe timestamps
 
-        max_workers = min(num_frames, self.config.max_workers)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(self._extract_single_frame, ts, thumb_width, thumb_height): i
-                for i, ts in enumerate(timestamps)
-            }
-
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
+        # Each worker runs its own decoder, so the worker count is also
+        # capped by the cores available per decoder: heavy codecs run two
+        # decode threads each, light codecs one. Oversubscribing decoders
+        # on small machines thrashes caches for no throughput gain.
+        max_workers = min(
+            num_frames,
+            self.config.max_workers,
+            max(1, (os.cpu_count() or 4) // self._decoder_threads),
+        )
+
+        # Instead of one container open + stream scan + seek per frame,
+        # sort the targets and split them into contiguous time ranges: each
+        # worker walks its range forward through a single shared container,
+        # so demuxer and decoder state are reused and seeks stay short.
+        order = sorted(range(num_frames), key=lambda i: timestamps[i])
+        chunks = []
+        for c in range(max_workers):
+            lo = c * num_frames // max_workers
+            hi = (c + 1) * num_frames // max_workers
+            if lo < hi:
+                chunks.append([(timestamps[i], i) for i in order[lo:hi]])
+
+        # Process pools sidestep the GIL for CPU-bound decoding, at the cost
+        # of pickling each extracted frame back; threads remain the default
+        # since PyAV releases the GIL inside libav calls.
+        executor_cls = ProcessPoolExecutor if self.config.worker_type == "process" else ThreadPoolExecutor
+        extract = partial(self._extract_batch, thumb_width=thumb_width, thumb_height=thumb_height)
+        errors: List[Exception] = []
+        with executor_cls(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(extract, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                if cancel is not None and cancel():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise CancelledError()
                 try:
-                    frame, actual_timestamp = future.result()
+                    batch = future.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    # Record the failure but keep draining: in-flight
+                    # batches finish (and close their containers) before
+                    # anything is raised, and every broken chunk gets
+                    # reported instead of just the first. Queued batches
+                    # that haven't started are dropped straight away.
+                    if not errors:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    errors.append(e)
+                    continue
+                for index, frame, actual_timestamp in batch:
                     frames[index] = frame
                     actual_timestamps[index] = actual_timestamp
-                except Exception as e:
-                    self.logger.error(f"Failed to extract frame {index}: {e}")
-                    raise
+
+        if errors:
+            for error in errors:
+                self.logger.error(f"Failed to extract frames: {error}")
+            raise RuntimeError(f"Frame extraction failed: {errors!r}")
 
         # Verify all frames were extracted
         if any(f is None for f in frames):
@@ -110,23 +166,49 @@ class FrameExtractor:
         # Return frames with actual keyframe timestamps (not the target timestamps)
         return frames, actual_timestamps  # type: ignore
 
-    def _extract_single_frame(
-        self, timestamp: float, thumb_width: int, thumb_height: int
-    ) -> Tuple[Image.Image, float]:
-        """Extract the next keyframe starting from the given timestamp.
+    def extract_frames_batched(
+        self, timestamp_chunks: List[List[Tuple[float, int]]]
+    ) -> List[Tuple[int, Image.Image, float]]:
+        """Extract frames for pre-chunked timestamps without a nested pool.
 
-        Seeks to the timestamp (or keyframe before it), then finds and uses the next keyframe.
-        This is faster than finding the closest keyframe as we stop at the first one found.
+        Entry point for callers that fan work out across processes
+        themselves (one task per chunk): the chunks run sequentially in
+        this process, each over its own container, so outer process
+        parallelism does not multiply with an inner thread pool.
 
         Args:
-            timestamp: Starting timestamp in seconds
+            timestamp_chunks: Lists of (timestamp, original index) pairs,
+                each sorted ascending by timestamp
+
+        Returns:
+            Flat list of (original index, PIL Image, actual keyframe timestamp)
+        """
+        thumb_width, thumb_height = compute_thumb_dims(self.config, self.video_info)
+        results: List[Tuple[int, Image.Image, float]] = []
+        for chunk in timestamp_chunks:
+            results.extend(self._extract_batch(chunk, thumb_width, thumb_height))
+        return results
+
+    def _extract_batch(
+        self, targets: List[Tuple[float, int]], thumb_width: int, thumb_height: int
+    ) -> List[Tuple[int, Image.Image, float]]:
+        """Extract the keyframe for each target timestamp from one container.
+
+        The targets are sorted ascending, so the container is opened and
+        its streams scanned once, and every seek moves forward through
+        the file with warm demuxer and decoder state — instead of paying
+        a format probe, codec init and cold seek per frame.
+
+        Args:
+            targets: (timestamp, original index) pairs, sorted by timestamp
             thumb_width: Target thumbnail width
             thumb_height: Target thumbnail height
 
         Returns:
-            Tuple of (PIL Image object, actual keyframe timestamp)
+            List of (original index, PIL Image, actual keyframe timestamp)
         """
-        container = av.open(self.video_info.path)
+        results: List[Tuple[int, Image.Image, float]] = []
+        container = self._open_container()
 
         try:
             # Get video stream
@@ -139,105 +221,185 @@ class FrameExtractor:
             if video_stream is None:
                 raise ValueError("No video stream found")
 
-            # Get the time base for converting frame PTS to seconds
+            # Match the decoder's threading to the worker budget above
+            video_stream.codec_context.thread_count = self._decoder_threads
+            if self._decoder_threads > 1:
+                video_stream.codec_context.thread_type = "FRAME"
+
+            # Only keyframes are ever used, so let the codec layer discard
+            # everything else: B/P packets skip motion compensation and
+            # reference reconstruction entirely instead of being decoded
+            # and then filtered out in Python.
+            video_stream.codec_context.skip_frame = "NONKEY"
+
+            # Thumbnails tolerate spec-noncompliant decoder shortcuts, so
+            # opt in to FAST. (FFmpeg's lowres quarter-resolution decode
+            # would fit even better, but modern builds dropped it for
+            # H.264/HEVC and PyAV does not expose it.)
+            video_stream.codec_context.flags2 |= Flags2.fast
+
+            # Split the time base into plain ints once: Fraction arithmetic
+            # (construction plus GCD reduction) on every seek and every
+            # decoded PTS adds up inside the demux loop.
             time_base = video_stream.time_base
+            tb_num, tb_den = time_base.numerator, time_base.denominator
+
+            # Evenly spaced targets inside the same GOP all resolve to the
+            # same keyframe; remember thumbnails by keyframe PTS so the
+            # seek still happens but the scale/convert work runs once.
+            seen: dict = {}
+
+            for timestamp, index in targets:
+                keyframe, keyframe_time = self._seek_keyframe(
+                    container, video_stream, timestamp, tb_num, tb_den
+                )
+
+                cached = seen.get(keyframe.pts) if keyframe.pts is not None else None
+                if cached is not None:
+                    results.append((index, cached.copy(), keyframe_time))
+                    continue
+
+                # Scale and convert in one libswscale pass: the bilinear
+                # downscale runs on the decoder's planar YUV (fewer bytes
+                # than RGB) fused with the YUV->RGB conversion, instead of
+                # materializing a full-resolution RGB image and resizing it
+                # with Pillow afterwards.
+                reformatted = keyframe.reformat(
+                    width=thumb_width, height=thumb_height, format="rgb24", interpolation="BILINEAR"
+                )
+                plane = reformatted.planes[0]
+                if plane.line_size == thumb_width * 3:
+                    # Wrap the swscale output plane directly instead of
+                    # copying it into a fresh image buffer
+                    pil_image = Image.frombuffer(
+                        "RGB", (thumb_width, thumb_height), plane, "raw", "RGB", 0, 1
+                    )
+                else:
+                    # Row padding in the plane: let PyAV handle the stride
+                    pil_image = reformatted.to_image()
 
-            # Seek to timestamp (or keyframe before it)
-            # Use backward=True to seek to keyframe before timestamp, then decode forward
-            seek_pts = int(timestamp / time_base)
-            container.seek(seek_pts, stream=video_stream, backward=True, any_frame=False)
-
-            # Find the next keyframe after seeking
-            keyframe = None
-            keyframe_time = None
-            packet_count = 0
-            max_packets = 15  # Usually only need a few packets to find next keyframe
-
-            # Also track the seek position keyframe as fallback
-            seek_position_keyframe = None
-            seek_position_time = None
-
-            for packet in container.demux(video_stream):
-                # Safety check: prevent infinite loops
-                packet_count += 1
-                if packet_count > max_packets:
-                    break
+                if keyframe.pts is not None:
+                    seen[keyframe.pts] = pil_image
+                results.append((index, pil_image, keyframe_time))
 
-                # Decode frames from packet, find first keyframe
-                for decoded_frame in packet.decode():
-                    # Only process keyframes (I-frames)
-                    if not decoded_frame.key_frame:
-                        continue  # Skip non-keyframes
-
-                    # Keep the first keyframe we find (at seek position) as fallback
-                    if seek_position_keyframe is None:
-                        seek_position_keyframe = decoded_frame
-                        if decoded_frame.pts is not None:
-                            seek_position_time = float(decoded_frame.pts * time_base)
-                        else:
-                            seek_position_time = timestamp
-
-                    # Found a keyframe after seek position - use it immediately
-                    keyframe = decoded_frame
-
-                    # Get keyframe timestamp
-                    if decoded_frame.pts is not None:
-                        keyframe_time = float(decoded_frame.pts * time_base)
-                    else:
-                        # Fallback: use target timestamp if keyframe has no PTS
-                        keyframe_time = timestamp
-
-                    # Found keyframe, exit immediately
-                    break
+            return results
 
-                # Exit if we found a keyframe
-                if keyframe is not None:
-                    break
+        finally:
+            container.close()
 
-            # Fallback: if no keyframe found after seek position, use the seek position keyframe
-            if keyframe is None:
-                if seek_position_keyframe is not None:
-                    # Use the keyframe at seek position (backward seek found a keyframe)
-                    keyframe = seek_position_keyframe
-                    keyframe_time = seek_position_time if seek_position_time is not None else timestamp
-                else:
-                    # Last resort: try seeking backward to find any keyframe
-                    container.seek(0, stream=video_stream, backward=False, any_frame=False)
-                    for packet in container.demux(video_stream):
-                        for decoded_frame in packet.decode():
-                            if decoded_frame.key_frame:
-                                keyframe = decoded_frame
-                                if decoded_frame.pts is not None:
-                                    keyframe_time = float(decoded_frame.pts * time_base)
-                                else:
-                                    keyframe_time = timestamp
-                                break
-                        if keyframe is not None:
-                            break
-
-                    # If still no keyframe found, raise error
-                    if keyframe is None:
-                        raise ValueError(f"Could not find any keyframe starting from timestamp {timestamp:.2f}s")
-
-            # Ensure we have a valid timestamp
-            if keyframe_time is None:
-                if keyframe.pts is not None:
-                    keyframe_time = float(keyframe.pts * time_base)
-                else:
-                    keyframe_time = timestamp  # Last resort fallback
+    def _open_container(self) -> "av.container.InputContainer":
+        """Open the source file, optionally with hardware decoding.
+
+        With config.use_hwaccel set, the first hardware device PyAV
+        reports (NVDEC/QSV/...) is tried with software fallback enabled;
+        any setup failure degrades to a plain software open.
+        """
+        if self.config.use_hwaccel:
+            try:
+                from av.codec.hwaccel import HWAccel, hwdevices_available
+
+                devices = hwdevices_available()
+                if devices:
+                    return av.open(
+                        self.video_info.path,
+                        hwaccel=HWAccel(device_type=devices[0], allow_software_fallback=True),
+                    )
+            except Exception as e:
+                self.logger.verbose(f"Hardware decode unavailable, using software: {e}")
+        return av.open(self.video_info.path)
+
+    def _seek_keyframe(
+        self,
+        container: "av.container.InputContainer",
+        video_stream: "av.video.stream.VideoStream",
+        timestamp: float,
+        tb_num: int,
+        tb_den: int,
+    ) -> Tuple["av.VideoFrame", float]:
+        """Seek to a timestamp and return the first keyframe found there.
+
+        Seeks backward to the keyframe at or before the timestamp, then
+        decodes forward to the first keyframe. Falls back to scanning
+        from the start of the file if the seek lands nowhere useful.
+
+        Args:
+            container: Open input container
+            video_stream: Video stream of the container
+            timestamp: Target timestamp in seconds
+            tb_num: Stream time base numerator
+            tb_den: Stream time base denominator
 
-            # Convert keyframe to PIL Image
-            pil_image = keyframe.to_image()
+        Returns:
+            Tuple of (keyframe, actual keyframe timestamp)
+        """
+        # Seek to timestamp (or keyframe before it)
+        # Use backward=True to seek to keyframe before timestamp, then decode forward
+        seek_pts = int(timestamp * tb_den / tb_num)
+        container.seek(seek_pts, stream=video_stream, backward=True, any_frame=False)
+
+        decoded_frame = self._first_keyframe(container, video_stream)
+        if decoded_frame is None:
+            # Last resort: snap to the stream's first keyframe. The backward
+            # seek lands on it directly, so a bounded decode suffices — the
+            # previous forward scan could walk the whole file on a bad seek.
+            container.seek(0, stream=video_stream, backward=True, any_frame=False)
+            decoded_frame = self._first_keyframe(container, video_stream)
+
+        if decoded_frame is None:
+            raise ValueError(f"Could not find any keyframe starting from timestamp {timestamp:.2f}s")
+
+        if decoded_frame.pts is not None:
+            return decoded_frame, decoded_frame.pts * tb_num / tb_den
+        # Fallback: use target timestamp if keyframe has no PTS
+        return decoded_frame, timestamp
+
+    @staticmethod
+    def _first_keyframe(
+        container: "av.container.InputContainer",
+        video_stream: "av.video.stream.VideoStream",
+    ) -> Optional["av.VideoFrame"]:
+        """Return the first keyframe the decoder emits from this position.
+
+        With skip_frame=NONKEY the reorder queue is starved of the
+        discarded B/P frames, so B-frame streams hold the keyframe back
+        until several more keyframes arrive. When the keyframe packet has
+        been fed but nothing came out, drain the decoder to force it out,
+        then reset the codec state for the next seek.
 
-            # Optimized resize: use BILINEAR instead of LANCZOS for 2-3x speed improvement
-            # BILINEAR is sufficient for thumbnails and much faster than LANCZOS
-            # Only resize if necessary (check size first to avoid unnecessary operation)
-            if pil_image.size[0] != thumb_width or pil_image.size[1] != thumb_height:
-                pil_image = pil_image.resize((thumb_width, thumb_height), Image.Resampling.BILINEAR)
+        Args:
+            container: Open input container, positioned by a prior seek
+            video_stream: Video stream of the container
 
-            # Return both the image and the actual keyframe timestamp
-            return pil_image, keyframe_time
+        Returns:
+            The decoded keyframe, or None if the scan budget ran out
+        """
+        packet_count = 0
+        max_packets = 15  # Usually only need a few packets to find next keyframe
+        fed_keyframe = False
+
+        for packet in container.demux(video_stream):
+            # Safety check: prevent infinite loops
+            packet_count += 1
+            if packet_count > max_packets:
+                break
+
+            fed_keyframe = fed_keyframe or packet.is_keyframe
+
+            # The decoder only emits keyframes (skip_frame=NONKEY), so use
+            # the first frame it produces
+            for decoded_frame in packet.decode():
+                return decoded_frame
+
+            if fed_keyframe:
+                # Keyframe is inside the decoder: drain it out
+                frame = None
+                for decoded_frame in video_stream.codec_context.decode(None):
+                    frame = decoded_frame
+                    break
+                video_stream.codec_context.flush_buffers()
+                if frame is not None:
+                    return frame
+                fed_keyframe = False
 
-        finally:
-            container.close()
+        return None
 
@@ -1,44 +1,59 @@
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView,
-    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication, QProgressBar
+    QTableView, QAbstractItemView, QHeaderView,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QRect, QSize
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QPainter, QColor, QBrush, QPen
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex, QRect, QSize, QTimer
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QPainter, QColor, QBrush, QPen, QRegion
 
 class StatusDelegate(QStyledItemDelegate):
     """Delegate for the Status column (Checkbox/Icon)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # subElementRect crosses into C++ style code per cell; the result
+        # only depends on the style and the row height, so cache it
+        self._rect_cache = {}
+
+    def _checkbox_rect(self, option: QStyleOptionViewItem, style) -> QRect:
+        """Checkbox rect centered in the cell, cached per style/row height."""
+        key = (id(style), option.rect.height())
+        template = self._rect_cache.get(key)
+        if template is None:
+            template = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, option, option.widget)
+            self._rect_cache[key] = template
+        rect = QRect(template)
+        rect.moveCenter(option.rect.center())
+        return rect
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
         # Draw the default checkbox logic or custom icon
         # For now, let's use the default check state behavior but centered
         # We can customize this further to match the specific green checkmark design later
-        
+
         # Ensure we don't draw the default focus rect
         option.state &= ~QStyle.State_HasFocus
-        
+
         # Get data
         checked = index.data(Qt.CheckStateRole) == Qt.Checked
-        
+
         # Draw background (alternating colors handled by table)
         if option.state & QStyle.State_Selected:
             painter.fillRect(option.rect, option.palette.highlight())
-        
+
         # Draw Checkbox (centered)
         style = option.widget.style()
-        checkbox_rect = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, option, option.widget)
-        
-        # Center the checkbox in the cell
-        checkbox_rect.moveCenter(option.rect.center())
-        
+        checkbox_rect = self._checkbox_rect(option, style)
+
         opt = QStyleOptionViewItem(option)
         opt.rect = checkbox_rect
         opt.state = opt.state & ~QStyle.State_HasFocus
-        
+
         if checked:
             opt.state |= QStyle.State_On
         else:
             opt.state |= QStyle.State_Off
-            
+
         style.drawPrimitive(QStyle.PE_IndicatorItemViewItemCheck, opt, painter, option.widget)
 
     def editorEvent(self, event, model, option, index):
@@ -46,9 +61,8 @@ class StatusDelegate(QStyledItemDelegate):
         if event.type() == event.MouseButtonRelease:
              # Calculate checkbox rect to see if click was inside
             style = option.widget.style()
-            checkbox_rect = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, option, option.widget)
-            checkbox_rect.moveCenter(option.rect.center())
-            
+            checkbox_rect = self._checkbox_rect(option, style)
+
             if checkbox_rect.contains(event.pos()):
                 current_state = index.data(Qt.CheckStateRole)
                 new_state = Qt.Unchecked if current_state == Qt.Checked else Qt.Checked
@@ -58,49 +72,143 @@ class StatusDelegate(QStyledItemDelegate):
 
 class InfoDelegate(QStyledItemDelegate):
     """Delegate for the Info column (Progress Bar + Text)."""
+
+    # Semi-transparent purple for the progress bar; built once instead of
+    # a fresh QColor per visible cell per paint event
+    _BAR_BRUSH = QBrush(QColor(200, 180, 255, 100))
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
-        painter.save()
-        
         # Draw background
         if option.state & QStyle.State_Selected:
             painter.fillRect(option.rect, option.palette.highlight())
-            
+
         # Get data
         progress = index.data(Qt.UserRole + 1) # Progress 0-100
         status_text = index.data(Qt.DisplayRole) # Text like "准备处理" or "30%"
-        
+
         rect = option.rect
-        
-        if isinstance(progress, int) and progress >= 0:
-            # Draw Progress Bar
-            # Define progress bar rect (e.g., bottom part of the cell or full background)
-            # Let's match the design: Text centered, maybe progress bar behind or small?
-            # The design shows "30%" text and a purple bar filling the cell partially?
-            # Or just text "准备处理"
-            
-            # If progress is active (e.g. > 0 and < 100, or specific state), draw bar
-            # For now, let's draw a simple progress bar at the bottom if progress > 0
-            
-            if progress > 0:
-                bar_height = rect.height() 
-                bar_width = int(rect.width() * (progress / 100.0))
-                bar_rect = QRect(rect.x(), rect.y(), bar_width, bar_height)
-                
-                # Use a light purple color for progress background
-                painter.fillRect(bar_rect, QColor(200, 180, 255, 100)) # Semi-transparent purple
-                
-        # Draw Text
-        painter.setPen(option.palette.text().color())
+
+        # Draw a simple progress bar filling the cell from the left.
+        # fillRect takes the coordinates directly, no intermediate QRect
+        if isinstance(progress, int) and progress > 0:
+            bar_width = int(rect.width() * (progress / 100.0))
+            painter.fillRect(rect.x(), rect.y(), bar_width, rect.height(), self._BAR_BRUSH)
+
+        # Draw Text; only the pen change needs save/restore
+        painter.save()
         if option.state & QStyle.State_Selected:
-             painter.setPen(option.palette.highlightedText().color())
-             
+            painter.setPen(option.palette.highlightedText().color())
+        else:
+            painter.setPen(option.palette.text().color())
+
         painter.drawText(rect, Qt.AlignCenter, status_text)
-        
+
         painter.restore()
 
-class FileListWidget(QTableWidget):
-    """Custom TableWidget that supports file drag and drop with specific columns."""
-    
+class _FileRow:
+    """Plain Python state for one listed file."""
+
+    __slots__ = ("path", "status", "progress", "checked", "tooltip")
+
+    def __init__(self, path):
+        self.path = path
+        self.status = "准备处理"
+        self.progress = 0
+        self.checked = False
+        self.tooltip = ""
+
+class FileTableModel(QAbstractTableModel):
+    """Table model over a plain list of file rows.
+
+    QTableWidget keeps a QTableWidgetItem per cell (three Qt objects per
+    file); this holds one slotted Python object per row and serves the
+    view on demand, so thousand-file lists insert in one rowsInserted
+    span and stay cheap to read back.
+    """
+
+    HEADERS = ["", "状态", "文件路径"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Path -> row membership mirror for O(1) duplicate checks
+        self._paths = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row.checked else Qt.Unchecked
+        elif column == 1:
+            if role == Qt.DisplayRole:
+                return row.status
+            if role == Qt.UserRole + 1:
+                return row.progress
+            if role == Qt.ToolTipRole:
+                return row.tooltip or None
+        elif column == 2:
+            if role == Qt.DisplayRole:
+                return row.path
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        if index.column() == 0 and role == Qt.CheckStateRole:
+            self._rows[index.row()].checked = value == Qt.Checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def add_paths(self, file_paths):
+        """Append the not-yet-listed paths in one insert span."""
+        new_paths = [p for p in file_paths if p not in self._paths]
+        if not new_paths:
+            return 0
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_paths) - 1)
+        for path in new_paths:
+            self._paths[path] = None
+            self._rows.append(_FileRow(path))
+        self.endInsertRows()
+        return len(new_paths)
+
+    def remove_row(self, row):
+        if row < 0 or row >= len(self._rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._rows.pop(row)
+        self._paths.pop(removed.path, None)
+        self.endRemoveRows()
+
+    def row(self, row):
+        return self._rows[row]
+
+    def paths(self):
+        return [row.path for row in self._rows]
+
+class FileListWidget(QTableView):
+    """File table view that supports drag and drop, backed by FileTableModel."""
+
     files_dropped = Signal(list)  # Signal emitted when files are dropped
 
     def __init__(self, parent=None):
@@ -111,24 +219,33 @@ class FileListWidget(QTableWidget):
         self.setAlternatingRowColors(True)
         self.setShowGrid(True) # Design shows grid lines
         self.verticalHeader().setVisible(False) # Hide row numbers
-        
-        # Setup Columns
-        self.setColumnCount(3)
-        self.setHorizontalHeaderLabels(["", "状态", "文件路径"])
-        
+        # Fixed uniform row height keeps the view's layout O(1) in rows
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        self._model = FileTableModel(self)
+        self.setModel(self._model)
+
         # Column Resizing
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed) # Status column fixed width
         header.setSectionResizeMode(1, QHeaderView.Fixed) # Info column fixed width
         header.setSectionResizeMode(2, QHeaderView.Stretch) # Path column stretches
-        
+
         self.setColumnWidth(0, 30) # Small width for checkbox
         self.setColumnWidth(1, 100) # Width for status/progress
-        
+
         # Set Delegates
         self.setItemDelegateForColumn(0, StatusDelegate(self))
         self.setItemDelegateForColumn(1, InfoDelegate(self))
 
+        # Progress ticks arrive faster than repaints are useful; dirty
+        # rects accumulate here and flush once per ~frame (16 ms)
+        self._dirty = QRegion()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_dirty)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -147,61 +264,64 @@ class FileListWidget(QTableWidget):
             path = Path(url.toLocalFile())
             if path.exists():
                 files.append(str(path))
-        
+
         if files:
             self.files_dropped.emit(files)
             event.acceptProposedAction()
-            
+
     def add_files(self, file_paths):
         """Add files to the list, avoiding duplicates."""
-        # Get existing paths
-        existing_paths = set()
-        for row in range(self.rowCount()):
-            item = self.item(row, 2)
-            if item:
-                existing_paths.add(item.text())
-        
-        for path in file_paths:
-            if path not in existing_paths:
-                row = self.rowCount()
-                self.insertRow(row)
-                
-                # Column 0: Status (Checkbox)
-                status_item = QTableWidgetItem()
-                status_item.setData(Qt.CheckStateRole, Qt.Unchecked) # Default unchecked
-                status_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable) # Not user checkable via standard way, handled by delegate? 
-                # Actually, let's make it user checkable for selection
-                status_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable)
-                self.setItem(row, 0, status_item)
-                
-                # Column 1: Info (Progress/Status)
-                info_item = QTableWidgetItem("准备处理")
-                info_item.setData(Qt.UserRole + 1, 0) # Progress 0
-                self.setItem(row, 1, info_item)
-                
-                # Column 2: File Path
-                path_item = QTableWidgetItem(str(path))
-                self.setItem(row, 2, path_item)
+        self._model.add_paths(file_paths)
+
+    def rowCount(self):
+        """Number of listed files (QTableWidget-compatible accessor)."""
+        return self._model.rowCount()
+
+    def removeRow(self, row):
+        """Remove a row, keeping the path mirror in sync."""
+        self._model.remove_row(row)
+
+    def paths(self):
+        """All listed file paths in row order, without touching the view.
+
+        Reading the path column cell by cell crosses the C++/Python
+        boundary per row; this reads the model's Python-side rows.
+        """
+        return self._model.paths()
 
     def set_row_status(self, row, status_text, progress=None):
         """Update the status text and progress for a specific row."""
-        if row < 0 or row >= self.rowCount():
+        if row < 0 or row >= self._model.rowCount():
             return
-            
-        item = self.item(row, 1)
-        if item:
-            item.setText(status_text)
-            if progress is not None:
-                item.setData(Qt.UserRole + 1, progress)
-            # Force update
-            self.viewport().update(self.visualItemRect(item))
+
+        file_row = self._model.row(row)
+        file_row.status = status_text
+        if progress is not None:
+            file_row.progress = progress
+        # Queue the repaint; many rows updating in one burst coalesce
+        # into a single paint event
+        self._dirty += self.visualRect(self._model.index(row, 1))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def set_row_tooltip(self, row, text):
+        """Set the tooltip shown on a row's status cell."""
+        if 0 <= row < self._model.rowCount():
+            self._model.row(row).tooltip = text
+
+    def _flush_dirty(self):
+        """Repaint the accumulated dirty region in one update."""
+        if not self._dirty.isEmpty():
+            self.viewport().update(self._dirty)
+            self._dirty = QRegion()
 
     def set_row_checked(self, row, checked):
         """Set the checked state of a row."""
-        if row < 0 or row >= self.rowCount():
+        if row < 0 or row >= self._model.rowCount():
             return
-            
-        item = self.item(row, 0)
-        if item:
-            state = Qt.Checked if checked else Qt.Unchecked
-            item.setData(Qt.CheckStateRole, state)
+
+        self._model.setData(
+            self._model.index(row, 0),
+            Qt.Checked if checked else Qt.Unchecked,
+            Qt.CheckStateRole,
+        )
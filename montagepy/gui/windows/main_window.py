@@ -1,9 +1,25 @@
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QFrame, QScrollArea, QSizePolicy
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLabel, QFrame, QScrollArea, QSizePolicy,
+    QButtonGroup, QCheckBox, QFileDialog, QMessageBox, QProgressBar, QRadioButton
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer, Slot
 from PySide6.QtGui import QIcon
+from collections import deque
+from functools import lru_cache
+import sys
+
+from montagepy.core.config import Config
+from montagepy.gui.workers import ProcessingController, ScannerThread
+from montagepy.gui.widgets.file_list import FileListWidget
+
+
+# Theme-icon lookups hit Qt's icon-theme engine (XDG disk scan on
+# Linux); resolve each name once and reuse the QIcon
+@lru_cache(maxsize=None)
+def _icon(name):
+    return QIcon.fromTheme(name)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -20,13 +36,31 @@ class MainWindow(QMainWindow):
         
         # Header
         self.setup_header()
-        
-        # Progress Section
-        self.setup_progress()
-        
+
         # File List Section
         self.setup_file_list()
-        
+
+        # Background folder scanners; referenced until their thread
+        # finishes so a QThread is never destroyed while still running
+        self._scanners = []
+
+        # Worker log lines buffer here and flush in one write every
+        # 250 ms; writing per line on the GUI thread stalls it when
+        # verbose workers emit thousands of lines per file
+        self._log_buf = deque(maxlen=10_000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(250)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Progress section and bottom panel are deferred to the first
+        # event-loop turn, so the window paints before they are built
+        QTimer.singleShot(0, self._finish_setup)
+
+    def _finish_setup(self):
+        # Progress Section
+        self.setup_progress()
+
         # Bottom Panel (Quick Settings)
         self.setup_bottom_panel()
 
@@ -38,10 +72,10 @@ class MainWindow(QMainWindow):
         actions_layout.setSpacing(16)
         
         self.btn_add_folder = QPushButton("添加文件夹")
-        self.btn_add_folder.setIcon(QIcon.fromTheme("folder-new")) # Placeholder icon
+        self.btn_add_folder.setIcon(_icon("folder-new")) # Placeholder icon
         
         self.btn_add_file = QPushButton("添加文件")
-        self.btn_add_file.setIcon(QIcon.fromTheme("video")) # Placeholder icon
+        self.btn_add_file.setIcon(_icon("video")) # Placeholder icon
         
         actions_layout.addWidget(self.btn_add_folder)
         actions_layout.addWidget(self.btn_add_file)
@@ -57,7 +91,7 @@ class MainWindow(QMainWindow):
         container_layout.setSpacing(4)
         
         self.btn_start = QPushButton()
-        self.btn_start.setIcon(QIcon.fromTheme("media-playback-start"))
+        self.btn_start.setIcon(_icon("media-playback-start"))
         self.btn_start.setToolTip("开始处理")
         self.btn_start.setFixedSize(32, 32)
         
@@ -83,15 +117,15 @@ class MainWindow(QMainWindow):
         header.addWidget(self.lbl_percent)
         
         # Progress Bar
-        from PySide6.QtWidgets import QProgressBar
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(8)
         
         layout.addLayout(header)
         layout.addWidget(self.progress_bar)
-        
-        self.main_layout.addWidget(progress_frame)
+
+        # Built after the file list; slot in between header and list
+        self.main_layout.insertWidget(1, progress_frame)
 
     def setup_file_list(self):
         file_list_frame = QFrame() 
@@ -113,7 +147,6 @@ class MainWindow(QMainWindow):
         header_layout.addStretch()
         
         # List Area
-        from montagepy.gui.widgets.file_list import FileListWidget
         self.file_list = FileListWidget()
         self.file_list.files_dropped.connect(self.add_files)
         
@@ -146,8 +179,6 @@ class MainWindow(QMainWindow):
         folder_layout = QHBoxLayout(folder_bg)
         folder_layout.setContentsMargins(8, 8, 8, 8)
         
-        from PySide6.QtWidgets import QCheckBox, QRadioButton, QButtonGroup
-        
         self.check_output = QCheckBox()
         self.check_output.setChecked(True)
         
@@ -156,7 +187,7 @@ class MainWindow(QMainWindow):
         self.lbl_output_path = QLabel("./output")
         
         self.btn_select_folder = QPushButton()
-        self.btn_select_folder.setIcon(QIcon.fromTheme("folder"))
+        self.btn_select_folder.setIcon(_icon("folder"))
         self.btn_select_folder.setFixedSize(24, 24)
         self.btn_select_folder.clicked.connect(self.select_output_folder)
         
@@ -218,31 +249,41 @@ class MainWindow(QMainWindow):
         self.btn_add_file.clicked.connect(self.add_file)
         self.btn_start.clicked.connect(self.start_processing)
 
+    @Slot(list)
     def add_files(self, files):
         """Add files to the list."""
         self.file_list.add_files(files)
         self.update_count()
 
+    @Slot()
     def add_folder(self):
         """Open dialog to select folder."""
-        from PySide6.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(self, "选择文件夹")
         if folder:
-            # Scan folder for video files
-            from montagepy.utils.file_utils import scan_video_files
-            files = scan_video_files(folder)
-            self.add_files(files)
+            # Scan in the background; batches stream into the list while
+            # large trees are still being walked
+            scanner = ScannerThread(folder)
+            scanner.batch_found.connect(self.add_files, Qt.QueuedConnection)
+            scanner.finished.connect(lambda s=scanner: self._scanner_finished(s))
+            self._scanners.append(scanner)
+            scanner.start()
 
+    def _scanner_finished(self, scanner):
+        """Release a scanner only once its thread has actually stopped."""
+        if scanner in self._scanners:
+            self._scanners.remove(scanner)
+        scanner.deleteLater()
+
+    @Slot()
     def add_file(self):
         """Open dialog to select files."""
-        from PySide6.QtWidgets import QFileDialog
         files, _ = QFileDialog.getOpenFileNames(self, "选择文件", "", "Video Files (*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm)")
         if files:
             self.add_files(files)
 
+    @Slot()
     def select_output_folder(self):
         """Open dialog to select output folder."""
-        from PySide6.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(self, "选择输出文件夹")
         if folder:
             self.lbl_output_path.setText(folder)
@@ -252,19 +293,16 @@ class MainWindow(QMainWindow):
         count = self.file_list.rowCount()
         self.count_badge.setText(str(count))
 
+    @Slot()
     def start_processing(self):
         """Start the montage generation process."""
-        files = []
-        for i in range(self.file_list.rowCount()):
-            files.append(self.file_list.item(i, 2).text())
-            
+        files = self.file_list.paths()
+
         if not files:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "提示", "请先添加视频文件")
             return
 
         # Create Config
-        from montagepy.core.config import Config
         cfg = Config()
         
         # Output settings
@@ -288,30 +326,34 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.lbl_percent.setText("0%")
         
-        # Start Thread
-        from montagepy.gui.workers import ProcessingThread
-        self.worker = ProcessingThread(files, cfg)
-        self.worker.progress_updated.connect(self.update_progress)
-        self.worker.log_message.connect(self.log_message)
-        self.worker.finished_processing.connect(self.processing_finished)
-        
+        # Start the pool-backed controller
+        self.worker = ProcessingController(files, cfg)
+        # Explicit queued connections: the worker emits from its own
+        # thread, and naming the type skips the per-emit auto-detection
+        self.worker.progress_updated.connect(self.update_progress, Qt.QueuedConnection)
+        self.worker.log_message.connect(self.log_message, Qt.QueuedConnection)
+        self.worker.finished_processing.connect(self.processing_finished, Qt.QueuedConnection)
+
         # Connect file-specific signals
-        self.worker.file_started.connect(self.on_file_started)
-        self.worker.file_finished.connect(self.on_file_finished)
-        self.worker.file_error.connect(self.on_file_error)
+        self.worker.file_started.connect(self.on_file_started, Qt.QueuedConnection)
+        self.worker.file_finished.connect(self.on_file_finished, Qt.QueuedConnection)
+        self.worker.file_error.connect(self.on_file_error, Qt.QueuedConnection)
         
         self.worker.start()
         
-    def update_progress(self, current, total):
-        if total > 0:
-            percent = int((current / total) * 100)
-            self.progress_bar.setValue(percent)
-            self.lbl_percent.setText(f"{percent}%")
+    # @Slot registers the methods with the meta-object system, so queued
+    # signal delivery skips PySide6's per-call method lookup
+    @Slot(int)
+    def update_progress(self, percent):
+        self.progress_bar.setValue(percent)
+        self.lbl_percent.setText(f"{percent}%")
             
+    @Slot(int, str)
     def on_file_started(self, row, file_path):
         """Handle file processing started."""
         self.file_list.set_row_status(row, "处理中...", 0)
         
+    @Slot(int, str, bool)
     def on_file_finished(self, row, file_path, success):
         """Handle file processing finished."""
         if success:
@@ -321,20 +363,33 @@ class MainWindow(QMainWindow):
             # Error state is handled by on_file_error usually, but ensure status is set
             pass
 
+    @Slot(int, str, str)
     def on_file_error(self, row, file_path, error_msg):
         """Handle file processing error."""
         self.file_list.set_row_status(row, "失败", 0)
         # Optional: Add tooltip or log error
-        item = self.file_list.item(row, 1)
-        if item:
-            item.setToolTip(error_msg)
+        self.file_list.set_row_tooltip(row, error_msg)
             
+    @Slot(str)
     def log_message(self, msg):
-        print(msg) # For now just print to console, could add a log widget later
+        # Buffered; flushed to the console in one write per timer tick
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot()
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
         
+    @Slot()
     def processing_finished(self):
         self.set_ui_enabled(True)
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "完成", "处理完成！")
         
     def set_ui_enabled(self, enabled):
@@ -1,14 +1,20 @@
-from PySide6.QtCore import QThread, Signal
+import threading
+import traceback
+from concurrent.futures import CancelledError
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
 from montagepy.core.handlers import process_single_file
-import traceback
+from montagepy.utils.file_utils import iter_video_files
 
 class GuiLogger(Logger):
     """Logger that emits signals for GUI updates."""
-    
+
     def __init__(self, signal: Signal):
         self.signal = signal
+        self.info_enabled = True
+        self.error_enabled = True
         self.verbose_enabled = False
 
     def info(self, msg, *args):
@@ -22,59 +28,139 @@ class GuiLogger(Logger):
     def warning(self, msg, *args):
         formatted_msg = msg % args if args else msg
         self.signal.emit(f"WARNING: {formatted_msg}")
-        
+
     def verbose(self, msg, *args):
         if self.verbose_enabled:
             formatted_msg = msg % args if args else msg
             self.signal.emit(f"DEBUG: {formatted_msg}")
 
-class ProcessingThread(QThread):
-    """Thread for processing video files."""
-    
-    progress_updated = Signal(int, int) # current, total
+class ScannerThread(QThread):
+    """Scans a directory for video files off the GUI thread.
+
+    Paths are emitted in batches as the scan finds them, so the file
+    list fills while large trees are still being walked instead of the
+    UI freezing on a full synchronous scan.
+    """
+
+    batch_found = Signal(list) # paths discovered since the last emit
+
+    BATCH_SIZE = 128
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+
+    def run(self):
+        batch = []
+        for path in iter_video_files(self.directory):
+            batch.append(path)
+            if len(batch) >= self.BATCH_SIZE:
+                self.batch_found.emit(batch)
+                batch = []
+        if batch:
+            self.batch_found.emit(batch)
+
+class FileJob(QRunnable):
+    """One file's worth of processing, scheduled on the controller's pool."""
+
+    def __init__(self, row: int, file_path: str, controller: "ProcessingController"):
+        super().__init__()
+        self.row = row
+        self.file_path = file_path
+        self.controller = controller
+
+    def run(self):
+        controller = self.controller
+        if controller.is_cancelled.is_set():
+            controller._job_done()
+            return
+
+        controller.file_started.emit(self.row, self.file_path)
+        try:
+            # The shared config is passed as-is; process_single_file
+            # detaches its own working copy for the per-file path
+            process_single_file(
+                controller.config,
+                controller.logger,
+                cancel=controller.is_cancelled.is_set,
+                input_path=self.file_path,
+            )
+            controller.file_finished.emit(self.row, self.file_path, True)
+
+        except CancelledError:
+            # User stop mid-file: not an error, just report it unfinished
+            controller.file_finished.emit(self.row, self.file_path, False)
+        except (KeyboardInterrupt, SystemExit):
+            # Cancellation, not a file failure: stop scheduling new work
+            controller.is_cancelled.set()
+            raise
+        except Exception as e:
+            # Format the traceback once and queue it through the log
+            # signal instead of printing synchronously from this thread
+            error_msg = str(e)
+            controller.logger.error(f"Failed to process {self.file_path}: {error_msg}")
+            controller.log_message.emit(traceback.format_exc())
+            controller.file_error.emit(self.row, self.file_path, error_msg)
+            controller.file_finished.emit(self.row, self.file_path, False)
+        finally:
+            controller._job_done()
+
+class ProcessingController(QObject):
+    """Runs the file jobs on a QThreadPool instead of a single serial thread.
+
+    Up to max_workers // 2 files process concurrently, so decode/encode of
+    one file overlaps the IO of another; each file still fans its own frame
+    extraction out internally, hence the halved budget.
+    """
+
+    progress_updated = Signal(int) # percent complete, 0-100
     log_message = Signal(str)
     finished_processing = Signal()
-    
-    # New signals for per-file progress
+
+    # Per-file progress
     file_started = Signal(int, str) # row_index, file_path
     file_finished = Signal(int, str, bool) # row_index, file_path, success
     file_error = Signal(int, str, str) # row_index, file_path, error_message
-    
+
     def __init__(self, files, config: Config):
         super().__init__()
         self.files = files
         self.config = config
-        self.is_running = True
+        self.logger = GuiLogger(self.log_message)
+        self.is_cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._done = 0
+        self._last_percent = -1
 
-    def run(self):
-        logger = GuiLogger(self.log_message)
+    def start(self):
+        pool = QThreadPool.globalInstance()
+        pool.setMaxThreadCount(max(2, self.config.max_workers // 2))
+        for row, file_path in enumerate(self.files):
+            pool.start(FileJob(row, file_path, self))
+
+    def _job_done(self):
+        """Called from job threads as each file finishes (or is skipped).
+
+        The percent is computed here with integer math and only emitted
+        when it changes, so a thousand-file batch queues at most 100
+        progress signals at the main thread instead of one per file. The
+        per-file row signals stay per-file since each changes visible
+        state.
+        """
         total = len(self.files)
-        
-        for i, file_path in enumerate(self.files):
-            if not self.is_running:
-                break
-                
-            self.progress_updated.emit(i, total)
-            self.file_started.emit(i, file_path)
-            
-            try:
-                # Create a copy of config for this file
-                file_config = Config()
-                file_config.__dict__.update(self.config.__dict__)
-                file_config.input_path = file_path
-                
-                # Process
-                process_single_file(file_config, logger)
-                self.file_finished.emit(i, file_path, True)
-                
-            except BaseException as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                self.file_error.emit(i, file_path, str(e))
-                self.file_finished.emit(i, file_path, False)
-                traceback.print_exc()
-                
-        self.progress_updated.emit(total, total)
-        self.finished_processing.emit()
+        with self._lock:
+            self._done += 1
+            done = self._done
+            percent = (done * 100) // total
+            emit_progress = percent != self._last_percent
+            if emit_progress:
+                self._last_percent = percent
+        if emit_progress:
+            self.progress_updated.emit(percent)
+        if done == total:
+            self.finished_processing.emit()
 
     def stop(self):
-        self.is_running = False
+        # Queued jobs see the event and fall through to _job_done, so the
+        # finished signal still fires once in-flight files drain
+        self.is_cancelled.set()
@@ -8,8 +8,9 @@ from PIL import Image, ImageDraw, ImageFont
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
-from montagepy.utils.color_utils import parse_color
+from montagepy.core.models import GifClip
 from montagepy.utils.format_utils import format_duration
+from montagepy.utils.grid_utils import compute_thumb_dims
 from montagepy.video_info import VideoInfo
 
 
@@ -42,37 +43,25 @@ class GifMontageRenderer:
             except Exception as e:
                 self.logger.verbose(f"Could not load font: {e}")
 
-    def render(self, gif_images: List[Image.Image], timestamps: List[float]) -> None:
+    def render(self, gif_clips: List[GifClip], timestamps: List[float]) -> None:
         """Render the GIF montage.
 
         Args:
-            gif_images: List of GIF image objects (each with _frames attribute)
-            timestamps: List of timestamps corresponding to GIFs
+            gif_clips: List of GifClip objects
+            timestamps: List of timestamps corresponding to clips
         """
         # Calculate thumbnail dimensions
-        thumb_width = self.config.thumb_width
-        thumb_height = self.config.thumb_height
-        if thumb_height <= 0:
-            if self.video_info.height == 0:
-                raise ValueError("Video height is 0, cannot auto-calculate thumbnail height")
-            thumb_height = int(thumb_width / (self.video_info.width / self.video_info.height))
-
-        # Extract frames from all GIFs
-        all_frames_lists = []
-        frame_duration = int(1000 / self.config.gif_fps)
-        loop_count = self.config.gif_loop
-        
-        for gif_img in gif_images:
-            if hasattr(gif_img, "_frames"):
-                all_frames_lists.append(gif_img._frames)  # type: ignore
-                # Get duration and loop from first GIF if available
-                if hasattr(gif_img, "_duration"):
-                    frame_duration = gif_img._duration  # type: ignore
-                if hasattr(gif_img, "_loop"):
-                    loop_count = gif_img._loop  # type: ignore
-            else:
-                # Fallback: treat as single frame
-                all_frames_lists.append([gif_img])
+        thumb_width, thumb_height = compute_thumb_dims(self.config, self.video_info)
+
+        # Extract frames from all clips; playback parameters are shared, so
+        # take them from the first clip
+        all_frames_lists = [clip.frames for clip in gif_clips]
+        if gif_clips:
+            frame_duration = gif_clips[0].duration_ms
+            loop_count = gif_clips[0].loop
+        else:
+            frame_duration = int(1000 / self.config.gif_fps)
+            loop_count = self.config.gif_loop
 
         # Synchronize frames (use minimum frame count)
         min_frames = min(len(frames) for frames in all_frames_lists if frames)
@@ -118,7 +107,7 @@ class GifMontageRenderer:
                 grid_frame.paste(timestamp_overlay, (0, 0), timestamp_overlay.split()[3] if timestamp_overlay.mode == "RGBA" else timestamp_overlay)
 
             # Combine with header
-            montage_frame = Image.new("RGB", (total_width, total_height), parse_color(self.config.background_color))
+            montage_frame = Image.new("RGB", (total_width, total_height), self.config.background_rgb)
             montage_frame.paste(header_image, (0, 0))
             montage_frame.paste(grid_frame, (0, self.config.header_height))
 
@@ -153,7 +142,7 @@ class GifMontageRenderer:
         Returns:
             Header image
         """
-        header_image = Image.new("RGB", (total_width, self.config.header_height), parse_color(self.config.background_color))
+        header_image = Image.new("RGB", (total_width, self.config.header_height), self.config.background_rgb)
         draw = ImageDraw.Draw(header_image)
 
         # Use preloaded fonts
@@ -213,8 +202,8 @@ class GifMontageRenderer:
             font_size -= 2
 
         # Draw filename
-        font_color = parse_color(self.config.font_color)
-        shadow_color = parse_color(self.config.shadow_color)
+        font_color = self.config.font_rgb
+        shadow_color = self.config.shadow_rgb
         center_x = total_width // 2
 
         # Calculate text position
@@ -275,7 +264,7 @@ class GifMontageRenderer:
         draw = ImageDraw.Draw(overlay)
 
         # Pre-parse colors
-        shadow_color = parse_color(self.config.shadow_color)
+        shadow_color = self.config.shadow_rgb
         white_color = (255, 255, 255)
 
         # Pre-format all timestamps
@@ -327,7 +316,7 @@ class GifMontageRenderer:
         total_height = grid_height + 2 * self.config.margin
 
         # Create canvas
-        bg_color = parse_color(self.config.background_color)
+        bg_color = self.config.background_rgb
         canvas = Image.new("RGB", (total_width, total_height), bg_color)
 
         # Draw frames (no timestamps here, they're added via overlay)
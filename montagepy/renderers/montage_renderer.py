@@ -8,8 +8,8 @@ from PIL import Image, ImageDraw, ImageFont
 
 from montagepy.core.config import Config
 from montagepy.core.logger import Logger
-from montagepy.utils.color_utils import parse_color
 from montagepy.utils.format_utils import format_duration
+from montagepy.utils.grid_utils import compute_thumb_dims
 from montagepy.video_info import VideoInfo
 
 
@@ -37,12 +37,7 @@ class MontageRenderer:
             layout: Optional custom grid layout
         """
         # Calculate thumbnail dimensions
-        thumb_width = self.config.thumb_width
-        thumb_height = self.config.thumb_height
-        if thumb_height <= 0:
-            if self.video_info.height == 0:
-                raise ValueError("Video height is 0, cannot auto-calculate thumbnail height")
-            thumb_height = int(thumb_width / (self.video_info.width / self.video_info.height))
+        thumb_width, thumb_height = compute_thumb_dims(self.config, self.video_info)
 
         # Calculate canvas dimensions
         grid_width = self.config.columns * thumb_width + (self.config.columns - 1) * self.config.padding
@@ -52,7 +47,7 @@ class MontageRenderer:
         total_height = grid_height + 2 * self.config.margin + self.config.header_height
 
         # Create canvas
-        bg_color = parse_color(self.config.background_color)
+        bg_color = self.config.background_rgb
         canvas = Image.new("RGB", (total_width, total_height), bg_color)
         draw = ImageDraw.Draw(canvas)
 
@@ -124,14 +119,14 @@ class MontageRenderer:
                 draw.text(
                     (text_x + 1, text_y + 1),
                     timestamp_str,
-                    fill=parse_color(self.config.shadow_color),
+                    fill=self.config.shadow_rgb,
                     font=timestamp_font,
                 )
                 # Draw text
                 draw.text(
                     (text_x, text_y),
                     timestamp_str,
-                    fill=parse_color("white"),
+                    fill=(255, 255, 255),
                     font=timestamp_font,
                 )
 
@@ -207,8 +202,8 @@ class MontageRenderer:
             font_size -= 2
 
         # Draw filename
-        font_color = parse_color(self.config.font_color)
-        shadow_color = parse_color(self.config.shadow_color)
+        font_color = self.config.font_rgb
+        shadow_color = self.config.shadow_rgb
 
         center_x = total_width // 2
 
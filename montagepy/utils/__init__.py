@@ -1,7 +1,12 @@
 """Utility modules for MontagePy."""
 
 from montagepy.utils.color_utils import parse_color
-from montagepy.utils.file_utils import generate_unique_filename, scan_video_files
+from montagepy.utils.file_utils import (
+    generate_unique_filename,
+    iter_video_files,
+    looks_like_directory,
+    scan_video_files,
+)
 from montagepy.utils.format_utils import format_duration
 from montagepy.utils.grid_utils import get_grid_size_by_duration
 
@@ -9,7 +14,9 @@ __all__ = [
     "parse_color",
     "format_duration",
     "scan_video_files",
+    "iter_video_files",
     "generate_unique_filename",
+    "looks_like_directory",
     "get_grid_size_by_duration",
 ]
 
@@ -1,7 +1,9 @@
 """File utility functions for MontagePy."""
 
-from pathlib import Path
-from typing import List
+import os
+import stat
+from pathlib import Path, PurePath
+from typing import Iterator, List
 
 # Common video file extensions
 VIDEO_EXTENSIONS = {
@@ -29,26 +31,68 @@ VIDEO_EXTENSIONS = {
 }
 
 
-def scan_video_files(directory: str) -> List[str]:
-    """Recursively scan directory for video files.
+def looks_like_directory(path: str) -> bool:
+    """Decide whether an output path should be treated as a directory.
+
+    An existing path is a directory if it stats as one; a missing path is
+    treated as a directory when its basename has no extension. One stat
+    syscall replaces the separate exists()/is_dir() probes (and their
+    Path allocations) the callers used to make.
 
     Args:
-        directory: Directory path to scan
+        path: Output path to classify
 
     Returns:
-        List of video file paths
+        True if the path is, or should become, a directory
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return "." not in os.path.basename(path)
+
+
+def iter_video_files(directory: str) -> Iterator[str]:
+    """Recursively yield video file paths as the scan discovers them.
+
+    Walks with os.scandir, whose dirent results carry the file type, so
+    classifying an entry needs no extra stat call (rglob stats every
+    path). Yielding incrementally lets callers show or batch results
+    while a large tree is still being scanned. Unreadable subdirectories
+    are skipped.
+
+    Args:
+        directory: Directory path to scan
+
+    Yields:
+        Video file paths, in scan order (not sorted)
     """
-    video_files = []
-    dir_path = Path(directory)
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        entry.is_file(follow_symlinks=False)
+                        and os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+                    ):
+                        yield entry.path
+        except OSError:
+            continue
 
-    if not dir_path.is_dir():
-        return video_files
 
-    for file_path in dir_path.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS:
-            video_files.append(str(file_path))
+def scan_video_files(directory: str) -> List[str]:
+    """Recursively scan directory for video files.
 
-    return sorted(video_files)
+    Args:
+        directory: Directory path to scan
+
+    Returns:
+        Sorted list of video file paths
+    """
+    return sorted(iter_video_files(directory))
 
 
 def generate_unique_filename(video_file: str, input_root: str, extension: str = "jpg") -> str:
@@ -60,7 +104,8 @@ def generate_unique_filename(video_file: str, input_root: str, extension: str =
 
     Args:
         video_file: Path to the video file
-        input_root: Root directory path used as base for relative path calculation
+        input_root: Root directory path used as base for relative path
+            calculation; a PurePath is taken as already resolved
         extension: File extension (default: "jpg")
 
     Returns:
@@ -81,20 +126,26 @@ def generate_unique_filename(video_file: str, input_root: str, extension: str =
         # Fallback if resolve() fails
         abs_video_file = video_path.absolute()
 
-    input_root_path = Path(input_root)
-    try:
-        # Try resolve() first
-        if input_root_path.exists():
-            abs_input_root = input_root_path.resolve()
-        else:
+    # Directory-mode callers resolve the (loop-invariant) root once and
+    # pass it pre-built, skipping the stat/resolve per file
+    if isinstance(input_root, PurePath):
+        abs_input_root = input_root
+    else:
+        input_root_path = Path(input_root)
+        try:
+            # Try resolve() first
+            if input_root_path.exists():
+                abs_input_root = input_root_path.resolve()
+            else:
+                abs_input_root = input_root_path.absolute()
+        except (OSError, RuntimeError, ValueError):
+            # Fallback if resolve() fails
             abs_input_root = input_root_path.absolute()
-    except (OSError, RuntimeError, ValueError):
-        # Fallback if resolve() fails
-        abs_input_root = input_root_path.absolute()
+        # Normalize (convert to same case on Windows, normalize separators)
+        abs_input_root = Path(str(abs_input_root))
 
     # Normalize paths (convert to same case on Windows, normalize separators)
     abs_video_file = Path(str(abs_video_file))
-    abs_input_root = Path(str(abs_input_root))
 
     # Get base filename without extension
     base_name = abs_video_file.stem
@@ -3,6 +3,33 @@
 from montagepy.core.config import Config
 
 
+def compute_thumb_dims(config: Config, video_info: "VideoInfo") -> tuple[int, int]:
+    """Resolve the thumbnail dimensions once for a processing run.
+
+    The height is only derived from the video aspect ratio when it is
+    not set explicitly, so callers no longer repeat the division (or its
+    zero-height check) per clip or per frame.
+
+    Args:
+        config: Configuration object
+        video_info: Video information
+
+    Returns:
+        Tuple of (width, height)
+
+    Raises:
+        ValueError: If the height must be derived and the video height is 0
+    """
+    thumb_width = config.thumb_width
+    thumb_height = config.thumb_height
+    if thumb_height <= 0:
+        aspect_ratio = video_info.aspect_ratio
+        if aspect_ratio == 0.0:
+            raise ValueError("Video height is 0, cannot auto-calculate thumbnail height")
+        thumb_height = int(thumb_width / aspect_ratio)
+    return thumb_width, thumb_height
+
+
 def get_grid_size_by_duration(config: Config, duration_seconds: float) -> tuple[int, int]:
     """Get grid size (columns, rows) based on video duration.
 
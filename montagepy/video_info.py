@@ -20,6 +20,11 @@ class VideoInfo:
     bit_rate: int
     avg_frame_rate: str
 
+    @property
+    def aspect_ratio(self) -> float:
+        """Width-to-height ratio (0.0 when the height is unknown)."""
+        return self.width / self.height if self.height else 0.0
+
 
 def get_video_info(video_path: str) -> VideoInfo:
     """Extract video information using PyAV.